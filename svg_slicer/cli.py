@@ -3,11 +3,19 @@ from __future__ import annotations
 import argparse
 import logging
 import math
+import os
+import queue
 import sys
+import weakref
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+import shapely
 from shapely.affinity import rotate as shapely_rotate
 from shapely.geometry import (
     GeometryCollection,
@@ -31,6 +39,7 @@ from .preview import render_toolpaths
 from .svg_parser import (
     VALID_ALIGNMENTS,
     ShapeGeometry,
+    _combined_bounds,
     fit_shapes_to_bed,
     normalize_alignment,
     place_shapes_on_bed,
@@ -41,6 +50,9 @@ logger = logging.getLogger(__name__)
 ProgressCallback = Callable[[str], None]
 _WHITE_BRIGHTNESS_THRESHOLD = 0.98
 _WHITE_SATURATION_THRESHOLD = 0.12
+_TOOLPATH_WORKERS = os.cpu_count() or 1
+_PROGRESS_POLL_SECONDS = 0.05
+_GCODE_WRITE_BUFFER = 1 << 20
 
 
 def _notify(progress_update: Optional[ProgressCallback], message: str) -> None:
@@ -48,23 +60,38 @@ def _notify(progress_update: Optional[ProgressCallback], message: str) -> None:
         progress_update(message)
 
 
+# Geometries already known to be valid, keyed by id() so repeated cleaning of
+# the same object skips the GEOS validity check. Shapely geometries do not
+# accept ad-hoc attributes, and weak values keep stale ids from matching.
+_CLEAN_GEOMETRIES: "weakref.WeakValueDictionary[int, BaseGeometry]" = weakref.WeakValueDictionary()
+
+
+def _mark_clean(geometry: BaseGeometry) -> BaseGeometry:
+    _CLEAN_GEOMETRIES[id(geometry)] = geometry
+    return geometry
+
+
 def _clean_geometry(geometry: BaseGeometry) -> BaseGeometry:
+    if _CLEAN_GEOMETRIES.get(id(geometry)) is geometry:
+        return geometry
     if geometry.is_empty:
         return geometry
-    geom = geometry
-    if geom.is_valid:
-        return geom
+    if geometry.is_valid:
+        return _mark_clean(geometry)
     if shapely_make_valid is not None:
         try:
-            geom = shapely_make_valid(geom)
+            # GEOS guarantees a valid result, so there is no need to re-check
+            # it or fall through to the much costlier buffer(0) repair.
+            return _mark_clean(shapely_make_valid(geometry))
         except Exception:  # pragma: no cover - defensive
-            geom = geometry
+            pass
+    try:
+        geom = geometry.buffer(0)
+    except Exception:  # pragma: no cover - defensive
+        return geometry
     if not geom.is_valid:
-        try:
-            geom = geom.buffer(0)
-        except Exception:  # pragma: no cover - defensive
-            return geometry
-    return geom
+        return geom
+    return _mark_clean(geom)
 
 
 def _brightness_to_density(brightness: float, config: SlicerConfig) -> float:
@@ -95,7 +122,8 @@ def _geometry_to_polygons(geometry: BaseGeometry) -> List[Polygon]:
     if isinstance(geometry, Polygon):
         return [geometry]
     if isinstance(geometry, MultiPolygon):
-        return list(geometry.geoms)
+        # Members of a valid MultiPolygon are valid polygons themselves.
+        return [_mark_clean(part) for part in geometry.geoms]
     if isinstance(geometry, GeometryCollection):
         polygons: List[Polygon] = []
         for part in geometry.geoms:
@@ -126,19 +154,10 @@ def _geometry_to_polylines(geometry: BaseGeometry) -> List[List[tuple[float, flo
 
 
 def _combined_shape_center(shapes: Iterable[ShapeGeometry]) -> tuple[float, float]:
-    bounds = [
-        shape.geometry.bounds
-        for shape in shapes
-        if not shape.geometry.is_empty
-        and len(shape.geometry.bounds) == 4
-        and all(math.isfinite(value) for value in shape.geometry.bounds)
-    ]
-    if not bounds:
+    bounds = _combined_bounds(shape.geometry for shape in shapes)
+    if bounds is None:
         raise ValueError("Artwork bounds are invalid; cannot rotate.")
-    minx = min(bound[0] for bound in bounds)
-    miny = min(bound[1] for bound in bounds)
-    maxx = max(bound[2] for bound in bounds)
-    maxy = max(bound[3] for bound in bounds)
+    minx, miny, maxx, maxy = bounds
     return ((minx + maxx) / 2.0, (miny + maxy) / 2.0)
 
 
@@ -178,54 +197,54 @@ def rotate_shapes(shapes: Iterable[ShapeGeometry], degrees: float) -> List[Shape
     return rotated
 
 
-def _ring_to_polyline(ring: LinearRing, tolerance: float) -> List[tuple[float, float]]:
-    coords = list(ring.coords)
-    if len(coords) < 2:
+def _rings_to_polylines(rings: List[LinearRing], tolerance: float) -> List[np.ndarray]:
+    # Extract, simplify and split every ring in a handful of vectorised
+    # Shapely calls rather than a LineString round trip per ring.
+    if not rings:
         return []
-    line = LineString(coords)
-    simplified = line.simplify(max(tolerance, 0.0), preserve_topology=True)
-    simplified_coords = list(simplified.coords)
-    if len(simplified_coords) < 3:
-        simplified_coords = coords
-    if simplified_coords[0] != simplified_coords[-1]:
-        simplified_coords.append(simplified_coords[0])
-    return [(float(x), float(y)) for x, y in simplified_coords]
-
-
-def _max_dimension(polygon: Polygon) -> float:
+    ring_array = np.asarray(rings, dtype=object)
+    ring_array = ring_array[shapely.get_num_coordinates(ring_array) >= 2]
+    if not len(ring_array):
+        return []
+    coords, ring_index = shapely.get_coordinates(ring_array, return_index=True)
+    ring_coords = np.split(coords, np.cumsum(np.bincount(ring_index, minlength=len(ring_array)))[:-1])
+    simplified_coords = ring_coords
+    if tolerance > 0:
+        lines = shapely.linestrings(coords, indices=ring_index)
+        simplified = shapely.simplify(lines, tolerance, preserve_topology=True)
+        flat, flat_index = shapely.get_coordinates(simplified, return_index=True)
+        simplified_coords = np.split(flat, np.cumsum(np.bincount(flat_index, minlength=len(ring_array)))[:-1])
+
+    # Stay in NumPy; toolpaths_from_polylines keeps the arrays as-is and only
+    # builds the tuple points once.
+    polylines: List[np.ndarray] = []
+    for original, candidate in zip(ring_coords, simplified_coords):
+        if len(candidate) < 3:
+            candidate = original
+        if not np.array_equal(candidate[0], candidate[-1]):
+            candidate = np.vstack([candidate, candidate[:1]])
+        polylines.append(candidate)
+    return polylines
+
+
+def _rotated_rectangle_extents(polygon: Polygon) -> tuple[float, float]:
     if polygon.is_empty:
-        return 0.0
-    rect = polygon.minimum_rotated_rectangle
-    coords = list(rect.exterior.coords)
+        return 0.0, 0.0
+    coords = shapely.get_coordinates(shapely.oriented_envelope(polygon))
     if len(coords) < 2:
-        return 0.0
-    edges = [
-        LineString([coords[i], coords[i + 1]]).length
-        for i in range(len(coords) - 1)
-    ]
-    if not edges:
-        return 0.0
-    return max(edges)
+        return 0.0, 0.0
+    deltas = np.diff(coords, axis=0)
+    edges = np.hypot(deltas[:, 0], deltas[:, 1])
+    return float(edges.min()), float(edges.max())
 
 
 def _min_dimension(polygon: Polygon) -> float:
-    if polygon.is_empty:
-        return 0.0
-    rect = polygon.minimum_rotated_rectangle
-    coords = list(rect.exterior.coords)
-    if len(coords) < 2:
-        return 0.0
-    edges = [
-        LineString([coords[i], coords[i + 1]]).length
-        for i in range(len(coords) - 1)
-    ]
-    if not edges:
-        return 0.0
-    return min(edges)
+    return _rotated_rectangle_extents(polygon)[0]
 
 
 def _fill_dimension(polygon: Polygon, mode: str) -> float:
-    return _max_dimension(polygon) if mode == "max" else _min_dimension(polygon)
+    shortest, longest = _rotated_rectangle_extents(polygon)
+    return longest if mode == "max" else shortest
 
 
 def _select_infill_regions(
@@ -244,6 +263,16 @@ def _select_infill_regions(
         return [polygon] if _fill_dimension(polygon, min_fill_mode) >= min_fill_width else []
 
     # "min" mode: keep only locally wide-enough regions using an opening operation.
+    # Each side of the rotated bounding rectangle is at least the polygon's
+    # minimum width, so a short side means no disk of the fill width fits and
+    # the opening would come back empty. The axis-aligned bounds bound the
+    # width from above too and are free, so try them before the hull.
+    min_x, min_y, max_x, max_y = polygon.bounds
+    if min(max_x - min_x, max_y - min_y) < min_fill_width:
+        return []
+    # An axis-aligned rectangle's minimum width is its narrower side.
+    if not _is_axis_aligned_rectangle(polygon) and _min_dimension(polygon) < min_fill_width:
+        return []
     radius = max(min_fill_width / 2.0, 1e-6)
     eroded = _clean_geometry(polygon.buffer(-radius))
     if eroded.is_empty:
@@ -253,35 +282,87 @@ def _select_infill_regions(
     return [part for part in _geometry_to_polygons(clipped) if not part.is_empty and part.area > 0]
 
 
+def _is_axis_aligned_rectangle(polygon: Polygon) -> bool:
+    if polygon.interiors:
+        return False
+    coords = polygon.exterior.coords
+    if len(coords) != 5:
+        return False
+    if len({x for x, _ in coords}) != 2 or len({y for _, y in coords}) != 2:
+        return False
+    return all(x1 == x2 or y1 == y2 for (x1, y1), (x2, y2) in zip(coords, coords[1:]))
+
+
+def _rectangle_perimeter_rings(polygon: Polygon, step: float, max_passes: int) -> List[LinearRing]:
+    # Concentric insets of an axis-aligned rectangle, laid out the way GEOS
+    # buffers them: each inset starts at the corner matching the outline's
+    # first vertex and runs clockwise.
+    corners = shapely.get_coordinates(polygon.exterior)[:4]
+    if polygon.exterior.is_ccw:
+        corners = corners[[0, 3, 2, 1]]
+    min_x, min_y, max_x, max_y = polygon.bounds
+    inward = np.column_stack(
+        (
+            np.where(corners[:, 0] == min_x, 1.0, -1.0),
+            np.where(corners[:, 1] == min_y, 1.0, -1.0),
+        )
+    )
+    half_width = min(max_x - min_x, max_y - min_y) / 2.0
+    insets = step * np.arange(1, max_passes)
+    # Skip insets that would collapse the rectangle to a line.
+    insets = insets[insets < half_width - 1e-9]
+
+    rings: List[LinearRing] = [polygon.exterior]
+    if len(insets):
+        inset_corners = corners[None, :, :] + inward[None, :, :] * insets[:, None, None]
+        rings.extend(shapely.linearrings(inset_corners))
+    return rings
+
+
 def _generate_perimeter_loops(
     polygon: Polygon,
     step: float,
     target_width: float,
     tolerance: float,
-) -> List[List[tuple[float, float]]]:
+) -> List[np.ndarray]:
     polygon = _clean_geometry(polygon)
     step = max(step, 1e-6)
     target_width = max(target_width, step)
     max_passes = max(1, int(math.ceil(target_width / step)))
-
-    loops: List[List[tuple[float, float]]] = []
-    current = polygon
-
-    for _ in range(max_passes):
-        current = _clean_geometry(current)
-        if current.is_empty or current.area <= 0:
+    if _is_axis_aligned_rectangle(polygon):
+        # Rectangles inset to rectangles, so skip the GEOS buffers.
+        rings = _rectangle_perimeter_rings(polygon, step, max_passes)
+        return [loop for loop in _rings_to_polylines(rings, tolerance) if len(loop) >= 2]
+
+    rings: List[LinearRing] = []
+    # Eroding by more than half the narrower bounding-box side always comes
+    # back empty, so stop before asking GEOS for it.
+    min_x, min_y, max_x, max_y = polygon.bounds
+    max_inset = min(max_x - min_x, max_y - min_y) / 2.0
+
+    # Offset every pass from the original outline: eroding by k * step in one
+    # buffer equals k successive erosions by step, without compounding the
+    # vertices each intermediate buffer adds. The passes are then independent,
+    # so all insets go to GEOS in a single vectorised buffer call.
+    insets = step * np.arange(1, max_passes)
+    insets = insets[insets <= max_inset]
+    passes = [polygon]
+    if len(insets):
+        # Match BaseGeometry.buffer, whose default is twice shapely.buffer's.
+        passes.extend(shapely.buffer(polygon, -insets, quad_segs=16))
+    for current in passes:
+        # Negative buffers come back valid from GEOS and the passes are only
+        # read for their rings, so skip the validity check. Valid polygons
+        # always have positive area, so an empty part list is the only
+        # stopping condition once the offset has eaten the shape.
+        pass_polygons = _geometry_to_polygons(_mark_clean(current))
+        if not pass_polygons:
             break
-        for poly in _geometry_to_polygons(current):
-            exterior = _ring_to_polyline(poly.exterior, tolerance)
-            if exterior:
-                loops.append(exterior)
-            for interior_ring in poly.interiors:
-                interior_polyline = _ring_to_polyline(interior_ring, tolerance)
-                if interior_polyline:
-                    loops.append(interior_polyline)
-        current = current.buffer(-step)
+        for poly in pass_polygons:
+            rings.append(poly.exterior)
+            rings.extend(poly.interiors)
 
-    return [loop for loop in loops if len(loop) >= 2]
+    return [loop for loop in _rings_to_polylines(rings, tolerance) if len(loop) >= 2]
 
 
 def _build_stroke_toolpaths(shape: ShapeGeometry, config: SlicerConfig) -> List[Toolpath]:
@@ -386,106 +467,186 @@ def _downsample_scaled_raster_shapes(
     ]
 
 
-def _build_toolpaths(
-    shapes: Iterable[ShapeGeometry],
+def _fill_regions_for_interior(
+    interior: BaseGeometry,
+    *,
+    min_fill_width: float,
+    min_fill_mode: str,
+) -> List[Polygon]:
+    regions: List[Polygon] = []
+    for infill_poly in _geometry_to_polygons(interior):
+        regions.extend(
+            _select_infill_regions(
+                infill_poly,
+                min_fill_width=min_fill_width,
+                min_fill_mode=min_fill_mode,
+            )
+        )
+    return regions
+
+
+def _build_shape_toolpaths(
+    shape: ShapeGeometry,
     config: SlicerConfig,
     *,
+    index: int,
+    total_shapes: int,
     progress_update: Optional[ProgressCallback] = None,
 ) -> List[Toolpath]:
+    if _is_effectively_white_shape(shape):
+        logger.debug("Skipping effectively white shape.")
+        return []
+    if shape.stroke_width is not None:
+        _notify(
+            progress_update,
+            f"Generating stroke outlines ({index}/{total_shapes})…",
+        )
+        return _build_stroke_toolpaths(shape, config)
+
+    _notify(
+        progress_update,
+        f"Preparing fill geometry ({index}/{total_shapes})…",
+    )
+    geometry = shape.geometry
+    if geometry.is_empty:
+        return []
+    polygons: List[Polygon]
+    polygons = _geometry_to_polygons(geometry)
+    if not polygons:
+        logger.debug("Skipping unsupported geometry type: %s", geometry.geom_type)
+        return []
+
     toolpaths: List[Toolpath] = []
-    shape_list = list(shapes)
-    total_shapes = len(shape_list)
     perimeter_width = max(config.perimeter.thickness, 0.0)
     perimeter_count = max(int(config.perimeter.count), 1)
     min_fill_width = max(config.perimeter.min_fill_width, 0.0)
     min_fill_mode = str(config.perimeter.min_fill_mode).strip().lower()
     if min_fill_mode not in {"min", "max"}:
         min_fill_mode = "min"
-    for index, shape in enumerate(shape_list, start=1):
-        if _is_effectively_white_shape(shape):
-            logger.debug("Skipping effectively white shape.")
-            continue
-        if shape.stroke_width is not None:
+    simplify_tolerance = config.sampling.outline_simplify_tolerance
+    infill_config = config.infill
+    perimeter_target_width = perimeter_width * perimeter_count
+    density = _brightness_to_density(shape.brightness, config)
+    for polygon in polygons:
+        fill_regions: List[Polygon]
+        if perimeter_width > 0:
             _notify(
                 progress_update,
-                f"Generating stroke outlines ({index}/{total_shapes})…",
+                f"Generating perimeters ({index}/{total_shapes})…",
             )
-            stroke_paths = _build_stroke_toolpaths(shape, config)
-            toolpaths.extend(stroke_paths)
-            continue
-
-        _notify(
-            progress_update,
-            f"Preparing fill geometry ({index}/{total_shapes})…",
-        )
-        geometry = shape.geometry
-        if geometry.is_empty:
-            continue
-        polygons: List[Polygon]
-        polygons = _geometry_to_polygons(geometry)
-        if not polygons:
-            logger.debug("Skipping unsupported geometry type: %s", geometry.geom_type)
-            continue
-        density = _brightness_to_density(shape.brightness, config)
-        for polygon in polygons:
-            polygon = _clean_geometry(polygon)
-            interior_geom: BaseGeometry | None = polygon
-
-            if perimeter_width > 0:
-                perimeter_target_width = perimeter_width * perimeter_count
-                _notify(
-                    progress_update,
-                    f"Generating perimeters ({index}/{total_shapes})…",
-                )
-                loops = _generate_perimeter_loops(
-                    polygon,
-                    perimeter_width,
-                    perimeter_target_width,
-                    config.sampling.outline_simplify_tolerance,
-                )
-                toolpaths.extend(
-                    toolpaths_from_polylines(
-                        loops,
-                        tag="outline",
-                        source_color=shape.color,
-                        brightness=shape.brightness,
-                    )
+            loops = _generate_perimeter_loops(
+                polygon,
+                perimeter_width,
+                perimeter_target_width,
+                simplify_tolerance,
+            )
+            toolpaths.extend(
+                toolpaths_from_polylines(
+                    loops,
+                    tag="outline",
+                    source_color=shape.color,
+                    brightness=shape.brightness,
                 )
+            )
+
+            # Keep infill touching the innermost perimeter by only offsetting
+            # inside by (count - 1) perimeter widths.
+            interior_offset = perimeter_width * max(perimeter_count - 1, 0)
+            interior_candidate = _clean_geometry(polygon.buffer(-interior_offset))
+            fill_regions = _fill_regions_for_interior(
+                interior_candidate,
+                min_fill_width=min_fill_width,
+                min_fill_mode=min_fill_mode,
+            )
+        else:
+            fill_regions = _fill_regions_for_interior(
+                polygon,
+                min_fill_width=min_fill_width,
+                min_fill_mode=min_fill_mode,
+            )
 
-                # Keep infill touching the innermost perimeter by only offsetting
-                # inside by (count - 1) perimeter widths.
-                interior_offset = perimeter_width * max(perimeter_count - 1, 0)
-                interior_candidate = _clean_geometry(polygon.buffer(-interior_offset))
-                if interior_candidate.is_empty:
-                    interior_geom = None
-                else:
-                    interior_geom = interior_candidate
-
-            if interior_geom and not interior_geom.is_empty:
-                _notify(
-                    progress_update,
-                    f"Generating infill ({index}/{total_shapes})…",
+        if fill_regions:
+            _notify(
+                progress_update,
+                f"Generating infill ({index}/{total_shapes})…",
+            )
+        for fill_region in fill_regions:
+            polylines = generate_rectilinear_infill(fill_region, density, infill_config)
+            toolpaths.extend(
+                toolpaths_from_polylines(
+                    polylines,
+                    tag="infill",
+                    source_color=shape.color,
+                    brightness=shape.brightness,
                 )
-                interior_geom = _clean_geometry(interior_geom)
-                for infill_poly in _geometry_to_polygons(interior_geom):
-                    infill_poly = _clean_geometry(infill_poly)
-                    for fill_region in _select_infill_regions(
-                        infill_poly,
-                        min_fill_width=min_fill_width,
-                        min_fill_mode=min_fill_mode,
-                    ):
-                        polylines = generate_rectilinear_infill(fill_region, density, config.infill)
-                        toolpaths.extend(
-                            toolpaths_from_polylines(
-                                polylines,
-                                tag="infill",
-                                source_color=shape.color,
-                                brightness=shape.brightness,
-                            )
-                        )
+            )
     return toolpaths
 
 
+def _build_toolpaths(
+    shapes: Iterable[ShapeGeometry],
+    config: SlicerConfig,
+    *,
+    progress_update: Optional[ProgressCallback] = None,
+) -> List[Toolpath]:
+    shape_results: List[List[Toolpath]] = []
+    shape_list = list(shapes)
+    total_shapes = len(shape_list)
+    workers = min(_TOOLPATH_WORKERS, total_shapes)
+    if workers <= 1:
+        for index, shape in enumerate(shape_list, start=1):
+            shape_results.append(
+                _build_shape_toolpaths(
+                    shape,
+                    config,
+                    index=index,
+                    total_shapes=total_shapes,
+                    progress_update=progress_update,
+                )
+            )
+        return list(chain.from_iterable(shape_results))
+
+    # Shapes are independent and GEOS releases the GIL, so fan them out across
+    # threads. Workers queue their progress messages and the calling thread
+    # relays them, because GUI callbacks must not run on worker threads.
+    messages: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+    executor = _toolpath_executor()
+    futures = {
+        executor.submit(
+            _build_shape_toolpaths,
+            shape,
+            config,
+            index=index,
+            total_shapes=total_shapes,
+            progress_update=messages.put if progress_update else None,
+        ): index - 1
+        for index, shape in enumerate(shape_list, start=1)
+    }
+    shape_results = [[] for _ in shape_list]
+    pending = set(futures)
+    completed = 0
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=_PROGRESS_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            while not messages.empty():
+                _notify(progress_update, messages.get_nowait())
+            for future in done:
+                shape_results[futures[future]] = future.result()
+                completed += 1
+                _notify(progress_update, f"Generating toolpaths ({completed}/{total_shapes})…")
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+    return list(chain.from_iterable(shape_results))
+
+
+@lru_cache(maxsize=1)
+def _toolpath_executor() -> ThreadPoolExecutor:
+    # One pool for the process rather than fresh threads for every slice.
+    return ThreadPoolExecutor(max_workers=_TOOLPATH_WORKERS, thread_name_prefix="svg-slicer-toolpaths")
+
+
 def generate_toolpaths_for_shapes(
     shapes: Iterable[ShapeGeometry],
     config: SlicerConfig,
@@ -554,26 +715,22 @@ class GcodeWriteResult:
     color_order: List[str]
 
 
+@lru_cache(maxsize=1024)
 def _hex_to_rgb(color: str) -> tuple[int, int, int]:
-    value = color.lstrip("#")
-    return (int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16))
-
-
-def _color_distance(a: tuple[int, int, int], b: tuple[int, int, int]) -> float:
-    dr = a[0] - b[0]
-    dg = a[1] - b[1]
-    db = a[2] - b[2]
-    return math.sqrt(dr * dr + dg * dg + db * db)
+    value = int(color.lstrip("#")[:6], 16)
+    return (value >> 16, (value >> 8) & 0xFF, value & 0xFF)
 
 
 _GRAY_SATURATION_THRESHOLD = 0.08
 
 
+@lru_cache(maxsize=1024)
 def _rgb_brightness(rgb: tuple[int, int, int]) -> float:
     r, g, b = rgb
     return (0.299 * r + 0.587 * g + 0.114 * b) / 255.0
 
 
+@lru_cache(maxsize=1024)
 def _rgb_saturation(rgb: tuple[int, int, int]) -> float:
     r, g, b = rgb
     maxc = max(r, g, b)
@@ -583,83 +740,96 @@ def _rgb_saturation(rgb: tuple[int, int, int]) -> float:
     return (maxc - minc) / maxc
 
 
-def _find_closest_palette_color(
-    source: tuple[int, int, int],
-    palette: List[str],
-    palette_rgb: Dict[str, tuple[int, int, int]],
-    palette_order: Dict[str, int],
-    grayscale_palette: List[str],
-    palette_brightness: Dict[str, float],
-) -> str:
-    source_sat = _rgb_saturation(source)
-    source_brightness = _rgb_brightness(source)
-
-    if grayscale_palette and source_sat <= _GRAY_SATURATION_THRESHOLD:
-        return min(
-            grayscale_palette,
-            key=lambda color: (
-                abs(source_brightness - palette_brightness[color]),
-                palette_order.get(color, math.inf),
-            ),
-        )
+def _rgb_array_brightness(rgb: np.ndarray) -> np.ndarray:
+    rgb = rgb.astype(np.float64)
+    return (0.299 * rgb[:, 0] + 0.587 * rgb[:, 1] + 0.114 * rgb[:, 2]) / 255.0
 
-    return min(
-        palette,
-        key=lambda color: (
-            _color_distance(source, palette_rgb[color]),
-            palette_order.get(color, math.inf),
-        ),
+
+def _rgb_array_saturation(rgb: np.ndarray) -> np.ndarray:
+    maxc = rgb.max(axis=1).astype(np.float64)
+    minc = rgb.min(axis=1).astype(np.float64)
+    saturation = np.zeros(len(rgb), dtype=np.float64)
+    np.divide(maxc - minc, maxc, out=saturation, where=maxc > 0)
+    return saturation
+
+
+def _assign_palette_indices(sources: np.ndarray, palette_array: np.ndarray) -> np.ndarray:
+    # Squared distance preserves the ordering of Euclidean distance, and argmin
+    # returns the first minimum so ties resolve to the earliest palette entry.
+    # |s - p|^2 = |s|^2 - 2 s.p + |p|^2, and |s|^2 is constant per row, so the
+    # ranking only needs one (N, P) product instead of an (N, P, 3) temporary.
+    palette_norms = (palette_array * palette_array).sum(axis=1)
+    indices = (palette_norms[None, :] - 2 * (sources @ palette_array.T)).argmin(axis=1)
+
+    grayscale_indices = np.flatnonzero(
+        _rgb_array_saturation(palette_array) <= _GRAY_SATURATION_THRESHOLD
     )
+    if grayscale_indices.size:
+        gray_sources = _rgb_array_saturation(sources) <= _GRAY_SATURATION_THRESHOLD
+        if gray_sources.any():
+            source_brightness = _rgb_array_brightness(sources[gray_sources])
+            gray_brightness = _rgb_array_brightness(palette_array[grayscale_indices])
+            gaps = np.abs(source_brightness[:, None] - gray_brightness[None, :])
+            indices[gray_sources] = grayscale_indices[gaps.argmin(axis=1)]
+    return indices
 
 
 def _toolpath_length(toolpath: Toolpath) -> float:
-    length = 0.0
-    points = list(toolpath.points)
-    for i in range(1, len(points)):
-        x1, y1 = points[i - 1]
-        x2, y2 = points[i]
-        length += math.hypot(x2 - x1, y2 - y1)
-    return length
+    if len(toolpath.points) < 2:
+        return 0.0
+    deltas = np.diff(np.asarray(toolpath.points, dtype=np.float64), axis=0)
+    return float(np.hypot(deltas[:, 0], deltas[:, 1]).sum())
 
 
 def _plan_color_sequence(toolpaths: List[Toolpath], config: SlicerConfig) -> ColorPlan | None:
     printer = config.printer
-    if not printer.color_mode or not printer.available_colors:
+    if not printer.color_mode or not printer.available_colors or not toolpaths:
         return None
 
     palette = printer.available_colors
-    palette_rgb = {color: _hex_to_rgb(color) for color in palette}
-    palette_order = {color: index for index, color in enumerate(palette)}
-    palette_brightness = {color: _rgb_brightness(rgb) for color, rgb in palette_rgb.items()}
-    palette_saturation = {color: _rgb_saturation(rgb) for color, rgb in palette_rgb.items()}
-    grayscale_palette = [color for color, sat in palette_saturation.items() if sat <= _GRAY_SATURATION_THRESHOLD]
-
-    color_groups: Dict[str, List[Toolpath]] = {}
-    usage: Dict[str, float] = {}
+    if len(palette) == 1:
+        # Every toolpath maps to the only pen, so skip the distance search.
+        color = palette[0]
+        if _is_effectively_white_rgb(_hex_to_rgb(color)):
+            return None
+        for toolpath in toolpaths:
+            toolpath.assigned_color = color
+        usage = {color: sum(_toolpath_length(toolpath) for toolpath in toolpaths)}
+        return ColorPlan(ordered_colors=[color], groups=[(color, list(toolpaths))], usage_by_color=usage)
+
+    palette_rgb = [_hex_to_rgb(color) for color in palette]
+    palette_array = np.array(palette_rgb, dtype=np.int32)
+    palette_is_white = np.array([_is_effectively_white_rgb(rgb) for rgb in palette_rgb], dtype=bool)
+    # Duplicate palette entries share one group, keyed by their first slot.
+    palette_slots = np.array([palette.index(color) for color in palette], dtype=np.intp)
     fallback_rgb = (0, 0, 0)
 
-    for toolpath in toolpaths:
-        source = toolpath.source_color or fallback_rgb
-        best_color = _find_closest_palette_color(
-            source,
-            palette,
-            palette_rgb,
-            palette_order,
-            grayscale_palette,
-            palette_brightness,
-        )
-        if _is_effectively_white_rgb(palette_rgb[best_color]):
-            continue
+    sources = np.array(
+        [toolpath.source_color or fallback_rgb for toolpath in toolpaths],
+        dtype=np.int32,
+    )
+    best_indices = _assign_palette_indices(sources, palette_array)
+    keep = ~palette_is_white[best_indices]
+    if not keep.any():
+        return None
+    kept_slots = palette_slots[best_indices[keep]]
+    kept_paths = [toolpath for toolpath, kept in zip(toolpaths, keep.tolist()) if kept]
+
+    # bincount adds each slot's lengths in toolpath order, exactly like a
+    # running sum per colour.
+    lengths = np.array([_toolpath_length(toolpath) for toolpath in kept_paths], dtype=np.float64)
+    slot_usage = np.bincount(kept_slots, weights=lengths, minlength=len(palette))
+
+    color_groups: Dict[str, List[Toolpath]] = {}
+    for toolpath, slot in zip(kept_paths, kept_slots.tolist()):
+        best_color = palette[slot]
         toolpath.assigned_color = best_color
         color_groups.setdefault(best_color, []).append(toolpath)
-        usage[best_color] = usage.get(best_color, 0.0) + _toolpath_length(toolpath)
-
-    if not color_groups:
-        return None
+    usage = {color: float(slot_usage[palette.index(color)]) for color in color_groups}
 
     ordered_colors = sorted(
         color_groups.keys(),
-        key=lambda color: (usage.get(color, 0.0), palette_order.get(color, math.inf)),
+        key=lambda color: (usage[color], palette.index(color)),
     )
     groups = [(color, color_groups[color]) for color in ordered_colors]
     return ColorPlan(ordered_colors=ordered_colors, groups=groups, usage_by_color=usage)
@@ -712,67 +882,77 @@ def write_toolpaths_to_gcode(
 ) -> GcodeWriteResult:
     _notify(progress_update, "Preparing G-code generator…")
     toolpath_list = list(toolpaths)
-    generator = GcodeGenerator(config.printer, verbose_comments=verbose_gcode)
-    generator.emit_header()
-    if verbose_gcode:
-        generator.emit_comment("Verbose G-code comments enabled.")
 
     _notify(progress_update, "Planning color sequence…")
     color_plan = _plan_color_sequence(toolpath_list, config)
     color_order: List[str] = []
 
-    if color_plan and color_plan.ordered_colors:
-        color_order = color_plan.ordered_colors
-        summary = " -> ".join(color_order)
-        generator.emit_comment(f"COLOR ORDER (least usage first): {summary}")
-        total_groups = len(color_plan.groups)
-        for index, (color, group_paths) in enumerate(color_plan.groups, start=1):
-            total_length = color_plan.usage_by_color.get(color, 0.0)
-            generator.emit_comment(
-                f"COLOR {index}/{total_groups}: {color} ({total_length:.1f} mm of drawing)"
-            )
-            generator.draw_toolpaths(
-                group_paths,
-                config.printer.feedrates,
-                optimize_order=not write_in_order,
-            )
-            if index < total_groups:
-                generator.emit_comment("Filament change before next color")
-                pause_commands = config.printer.pause_gcode or ["M600"]
-                next_color = color_plan.groups[index][0]
-                for command in pause_commands:
-                    generator.emit_command(
-                        _format_pause_command(
-                            command,
-                            config,
-                            current_color=color,
-                            next_color=next_color,
-                            index=index,
-                            total=total_groups,
-                        )
+    # Stream lines into a sibling temp file rather than holding the whole
+    # program in memory, and only replace the output once it is complete so
+    # a failure never leaves a truncated file behind.
+    _notify(progress_update, "Writing G-code to disk…")
+    temp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with temp_path.open("w", encoding="utf-8", buffering=_GCODE_WRITE_BUFFER) as stream:
+            generator = GcodeGenerator(config.printer, verbose_comments=verbose_gcode, stream=stream)
+            generator.emit_header()
+            if verbose_gcode:
+                generator.emit_comment("Verbose G-code comments enabled.")
+
+            if color_plan and color_plan.ordered_colors:
+                color_order = color_plan.ordered_colors
+                summary = " -> ".join(color_order)
+                generator.emit_comment(f"COLOR ORDER (least usage first): {summary}")
+                total_groups = len(color_plan.groups)
+                for index, (color, group_paths) in enumerate(color_plan.groups, start=1):
+                    total_length = color_plan.usage_by_color.get(color, 0.0)
+                    generator.emit_comment(
+                        f"COLOR {index}/{total_groups}: {color} ({total_length:.1f} mm of drawing)"
                     )
-    elif config.printer.color_mode:
-        generator.emit_comment("No non-white toolpaths after palette assignment.")
-    else:
-        generator.draw_toolpaths(
-            toolpath_list,
-            config.printer.feedrates,
-            optimize_order=not write_in_order,
-        )
+                    generator.draw_toolpaths(
+                        group_paths,
+                        config.printer.feedrates,
+                        optimize_order=not write_in_order,
+                    )
+                    if index < total_groups:
+                        generator.emit_comment("Filament change before next color")
+                        pause_commands = config.printer.pause_gcode or ["M600"]
+                        next_color = color_plan.groups[index][0]
+                        for command in pause_commands:
+                            generator.emit_command(
+                                _format_pause_command(
+                                    command,
+                                    config,
+                                    current_color=color,
+                                    next_color=next_color,
+                                    index=index,
+                                    total=total_groups,
+                                )
+                            )
+            elif config.printer.color_mode:
+                generator.emit_comment("No non-white toolpaths after palette assignment.")
+            else:
+                generator.draw_toolpaths(
+                    toolpath_list,
+                    config.printer.feedrates,
+                    optimize_order=not write_in_order,
+                )
 
-    estimated_text = generator.formatted_elapsed_time()
-    generator.emit_comment(f"Estimated plot time: {estimated_text}")
-    generator.emit_footer()
+            estimated_text = generator.formatted_elapsed_time()
+            generator.emit_comment(f"Estimated plot time: {estimated_text}")
+            generator.emit_footer()
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
-    _notify(progress_update, "Writing G-code to disk…")
-    gcode_lines = generator.generate()
-    output_path.write_text("\n".join(gcode_lines) + "\n", encoding="utf-8")
-    logger.info("Wrote %d G-code lines to %s", len(gcode_lines), output_path)
+    line_count = generator.line_count
+    logger.info("Wrote %d G-code lines to %s", line_count, output_path)
     if color_order:
         logger.info("Color order: %s", " -> ".join(color_order))
     logger.info("Estimated plot time: %s (motion only)", estimated_text)
     _notify(progress_update, "G-code saved.")
-    return GcodeWriteResult(line_count=len(gcode_lines), color_order=color_order)
+    return GcodeWriteResult(line_count=line_count, color_order=color_order)
 
 
 def _parse_scale_argument(value: str) -> Optional[float]:
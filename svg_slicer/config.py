@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import copy
 import pathlib
-import re
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Dict, List
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
-@dataclass
+
+@dataclass(slots=True)
 class Feedrates:
     draw_mm_s: float
     travel_mm_s: float
@@ -27,7 +34,7 @@ class Feedrates:
         return self.z_mm_s * 60.0
 
 
-@dataclass
+@dataclass(slots=True)
 class PrinterConfig:
     name: str
     bed_width: float
@@ -62,7 +69,7 @@ class PrinterConfig:
         return self.y_max - self.y_min
 
 
-@dataclass
+@dataclass(slots=True)
 class InfillConfig:
     base_spacing: float
     min_density: float
@@ -70,7 +77,7 @@ class InfillConfig:
     angles: List[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class SamplingConfig:
     segment_tolerance: float
     outline_simplify_tolerance: float
@@ -88,12 +95,12 @@ class SamplingConfig:
     plot_stroke_width_threshold: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderingConfig:
     line_width: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PerimeterConfig:
     thickness: float
     count: int
@@ -101,7 +108,7 @@ class PerimeterConfig:
     min_fill_mode: str = "min"
 
 
-@dataclass
+@dataclass(slots=True)
 class SlicerConfig:
     printer: PrinterConfig
     infill: InfillConfig
@@ -114,7 +121,7 @@ class ConfigError(Exception):
     """Raised when configuration values are missing or invalid."""
 
 
-_HEX_COLOR_RE = re.compile(r"^[0-9A-Fa-f]{6}$")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
 
 
 def _normalize_hex_color(value: str) -> str:
@@ -125,15 +132,46 @@ def _normalize_hex_color(value: str) -> str:
     stripped = value.strip()
     if stripped.startswith("#"):
         stripped = stripped[1:]
-    if len(stripped) != 6 or not _HEX_COLOR_RE.match(stripped):
+    # A set check rather than int(..., 16), which would also take "0x1234",
+    # signs, underscores and non-ASCII digits.
+    if len(stripped) != 6 or not _HEX_DIGITS.issuperset(stripped):
         raise ConfigError(f"Invalid hex color '{value}'. Expected format '#RRGGBB'.")
     return f"#{stripped.upper()}"
 
 
+_MISSING = object()
+
+
 def _require(mapping: Dict[str, Any], key: str) -> Any:
-    if key not in mapping:
+    value = mapping.get(key, _MISSING)
+    if value is _MISSING:
         raise ConfigError(f"Missing required configuration key: {key}")
-    return mapping[key]
+    return value
+
+
+def _require_items(mapping: Dict[str, Any], *keys: str) -> tuple[Any, ...]:
+    try:
+        return itemgetter(*keys)(mapping) if len(keys) > 1 else (mapping[keys[0]],)
+    except KeyError:
+        missing = next(key for key in keys if key not in mapping)
+        raise ConfigError(f"Missing required configuration key: {missing}") from None
+
+
+def _require_floats(mapping: Dict[str, Any], *keys: str) -> tuple[float, ...]:
+    values = _require_items(mapping, *keys)
+    try:
+        return tuple(map(float, values))
+    except (TypeError, ValueError):
+        name = next(key for key, value in zip(keys, values) if not _is_float_like(value))
+        raise ConfigError(f"'{name}' must be a numeric value.") from None
+
+
+def _is_float_like(value: Any) -> bool:
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
 
 
 def _optional_command(printer_raw: Dict[str, Any], key: str) -> str | None:
@@ -220,17 +258,14 @@ def _normalize_blur_kernel(value: Any) -> int:
     return kernel
 
 
+_PRINTER_SECTIONS = ("bed_size_mm", "origin_offsets_mm", "z_heights_mm", "feedrates_mm_s")
+
+
 def _parse_printer_config(printer_raw: Dict[str, Any], fallback_name: str | None = None) -> PrinterConfig:
-    bed = _require(printer_raw, "bed_size_mm")
-    offsets = _require(printer_raw, "origin_offsets_mm")
-    z_heights = _require(printer_raw, "z_heights_mm")
-    feedrates_raw = _require(printer_raw, "feedrates_mm_s")
-
-    feedrates = Feedrates(
-        draw_mm_s=float(_require(feedrates_raw, "draw")),
-        travel_mm_s=float(_require(feedrates_raw, "travel")),
-        z_mm_s=float(_require(feedrates_raw, "z")),
-    )
+    bed, offsets, z_heights, feedrates_raw = _require_items(printer_raw, *_PRINTER_SECTIONS)
+
+    draw_mm_s, travel_mm_s, z_mm_s = _require_floats(feedrates_raw, "draw", "travel", "z")
+    feedrates = Feedrates(draw_mm_s=draw_mm_s, travel_mm_s=travel_mm_s, z_mm_s=z_mm_s)
 
     printer_name = str(printer_raw.get("name", fallback_name or "PenPlotter"))
 
@@ -261,16 +296,19 @@ def _parse_printer_config(printer_raw: Dict[str, Any], fallback_name: str | None
     if not pause_gcode:
         pause_gcode.append("M600")
 
+    bed_width, bed_depth = _require_floats(bed, "width", "depth")
+    x_min, x_max, y_min, y_max = _require_floats(offsets, "x_min", "x_max", "y_min", "y_max")
+    z_draw, z_travel = _require_floats(z_heights, "draw", "travel")
     return PrinterConfig(
         name=printer_name,
-        bed_width=float(_require(bed, "width")),
-        bed_depth=float(_require(bed, "depth")),
-        x_min=float(_require(offsets, "x_min")),
-        x_max=float(_require(offsets, "x_max")),
-        y_min=float(_require(offsets, "y_min")),
-        y_max=float(_require(offsets, "y_max")),
-        z_draw=float(_require(z_heights, "draw")),
-        z_travel=float(_require(z_heights, "travel")),
+        bed_width=bed_width,
+        bed_depth=bed_depth,
+        x_min=x_min,
+        x_max=x_max,
+        y_min=y_min,
+        y_max=y_max,
+        z_draw=z_draw,
+        z_travel=z_travel,
         z_raster_travel=float(z_heights.get("raster_travel", z_heights.get("travel"))),
         z_lift=float(printer_raw.get("z_lift_height_mm", z_heights.get("travel", 5.0))),
         glide_threshold=float(printer_raw.get("glide_threshold_mm", 0.8)),
@@ -288,14 +326,31 @@ def _parse_printer_config(printer_raw: Dict[str, Any], fallback_name: str | None
     )
 
 
+# Built configs keyed by (resolved path, mtime_ns, size, profile); editing
+# the file changes the key, so stale entries just age out of the LRU.
+_CONFIG_CACHE_SIZE = 16
+
+
 def load_config(path: str | pathlib.Path, profile: str | None = None) -> SlicerConfig:
     config_path = pathlib.Path(path)
     if not config_path.exists():
         raise ConfigError(f"Configuration file not found: {config_path}")
 
-    with config_path.open("r", encoding="utf-8") as fh:
-        raw = yaml.safe_load(fh) or {}
+    stat = config_path.stat()
+    config = _load_config_cached(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size, profile)
+    # Callers adjust the returned config (CLI overrides, GUI settings), so
+    # each gets its own copy and the cached one is never handed out.
+    return copy.deepcopy(config)
+
 
+@lru_cache(maxsize=_CONFIG_CACHE_SIZE)
+def _load_config_cached(path: str, mtime_ns: int, size: int, profile: str | None) -> SlicerConfig:
+    with open(path, "r", encoding="utf-8") as fh:
+        raw = yaml.load(fh, Loader=_SafeLoader) or {}
+    return _build_config(raw, profile)
+
+
+def _build_config(raw: Any, profile: str | None) -> SlicerConfig:
     printer_raw: Dict[str, Any]
     printer_profile_name: str | None = None
 
@@ -336,10 +391,13 @@ def load_config(path: str | pathlib.Path, profile: str | None = None) -> SlicerC
     printer = _parse_printer_config(printer_raw, fallback_name=printer_profile_name)
 
     infill_raw = _require(raw, "infill")
+    base_spacing, min_density, max_density = _require_floats(
+        infill_raw, "base_line_spacing_mm", "min_density", "max_density"
+    )
     infill = InfillConfig(
-        base_spacing=float(_require(infill_raw, "base_line_spacing_mm")),
-        min_density=float(_require(infill_raw, "min_density")),
-        max_density=float(_require(infill_raw, "max_density")),
+        base_spacing=base_spacing,
+        min_density=min_density,
+        max_density=max_density,
         angles=list(_require(infill_raw, "angles_degrees")),
     )
 
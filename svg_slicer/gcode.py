@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import io
 import logging
 import math
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from itertools import compress, islice
+from typing import Iterable, List, Sequence, TextIO, Tuple
+
+import numpy as np
 
 from .config import Feedrates, PrinterConfig
 
@@ -37,6 +41,12 @@ class Toolpath:
     brightness: float | None = None
     glide_group: str | None = None
 
+    @property
+    def points_array(self) -> np.ndarray:
+        # Built on demand rather than stored, so it costs no memory between
+        # uses and can never disagree with ``points``.
+        return np.asarray(self.points, dtype=np.float64).reshape(-1, 2)
+
 
 def _optimize_toolpath_order(
     toolpaths: Iterable[Toolpath],
@@ -47,57 +57,72 @@ def _optimize_toolpath_order(
     if len(remaining) <= 1:
         return remaining
 
+    # Greedy nearest-neighbour tour over the endpoints, with the distances
+    # to every remaining path computed in one NumPy pass per step. Only the
+    # chosen path is ever reversed.
+    starts = np.array([toolpath.points[0] for toolpath in remaining], dtype=np.float64)
+    ends = np.array([toolpath.points[-1] for toolpath in remaining], dtype=np.float64)
+    taken = np.zeros(len(remaining), dtype=bool)
+
     ordered: List[Toolpath] = []
     current = start_point
-
-    while remaining:
-        best_index = 0
-        best_path = remaining[0]
-        best_gap = math.inf
-
-        for index, toolpath in enumerate(remaining):
-            start_gap = _distance(current, toolpath.points[0])
-            end_gap = _distance(current, toolpath.points[-1])
-
-            candidate = toolpath
-            gap = start_gap
-            if end_gap + 1e-9 < start_gap:
-                candidate = _reversed_toolpath(toolpath)
-                gap = end_gap
-
-            if gap + 1e-9 < best_gap:
-                best_index = index
-                best_path = candidate
-                best_gap = gap
-
+    for _ in range(len(remaining)):
+        start_gaps = np.hypot(starts[:, 0] - current[0], starts[:, 1] - current[1])
+        end_gaps = np.hypot(ends[:, 0] - current[0], ends[:, 1] - current[1])
+        reverse = end_gaps + 1e-9 < start_gaps
+        gaps = np.where(reverse, end_gaps, start_gaps)
+        gaps[taken] = math.inf
+        # A later path only wins when it is closer by more than the tolerance,
+        # so take the first one within it of the minimum.
+        best_index = int(np.flatnonzero(gaps <= gaps.min() + 1e-9)[0])
+        taken[best_index] = True
+
+        best_path = remaining[best_index]
+        if reverse[best_index]:
+            best_path = _reversed_toolpath(best_path)
         ordered.append(best_path)
         current = best_path.points[-1]
-        remaining.pop(best_index)
 
     return ordered
 
 
 class GcodeGenerator:
-    def __init__(self, printer: PrinterConfig, *, verbose_comments: bool = False) -> None:
+    def __init__(
+        self,
+        printer: PrinterConfig,
+        *,
+        verbose_comments: bool = False,
+        stream: TextIO | None = None,
+    ) -> None:
         self.printer = printer
         self.verbose_comments = verbose_comments
-        self._gcode: List[str] = []
+        # Lines go to ``stream`` when given (e.g. an open output file);
+        # otherwise they are kept in memory for generate()/getvalue().
+        self._buffer: TextIO = stream if stream is not None else io.StringIO()
+        self._streamed = stream is not None
+        self._line_count = 0
         self._position: Point | None = None
         self._z_height: float = printer.z_travel
         self._pen_is_down = False
         self._feedrate: float | None = None
         self._elapsed_time: float = 0.0
+        # Formatted "F..." words; a job only ever uses a handful of feedrates.
+        self._feed_words: dict[float, str] = {}
 
     def _emit(self, line: str) -> None:
-        self._gcode.append(line)
+        self._buffer.write(line)
+        self._buffer.write("\n")
+        self._line_count += 1
 
-    def _format_xy(self, point: Point) -> str:
-        x, y = point
-        return f"X{x:.3f} Y{y:.3f}"
+    def _feed_word(self, feedrate: float) -> str:
+        word = self._feed_words.get(feedrate)
+        if word is None:
+            word = self._feed_words[feedrate] = f"F{feedrate:.0f}"
+        return word
 
     def _emit_with_feed(self, command: str, point_fmt: str, feedrate: float) -> None:
         if self._feedrate != feedrate:
-            self._emit(f"{command} {point_fmt} F{feedrate:.0f}")
+            self._emit(f"{command} {point_fmt} {self._feed_word(feedrate)}")
             self._feedrate = feedrate
         else:
             self._emit(f"{command} {point_fmt}")
@@ -108,9 +133,10 @@ class GcodeGenerator:
         if self._position is not None:
             distance = _distance(self._position, point)
             self._accumulate_motion_time(distance, feedrate)
+        x, y = point
         self._emit_with_feed(
             self.printer.travel_move_command or "G0",
-            self._format_xy(point),
+            f"X{x:.3f} Y{y:.3f}",
             feedrate,
         )
         self._position = point
@@ -121,19 +147,42 @@ class GcodeGenerator:
         if self._position is not None:
             distance = _distance(self._position, point)
             self._accumulate_motion_time(distance, feedrate)
+        x, y = point
         self._emit_with_feed(
             self.printer.draw_move_command or "G1",
-            self._format_xy(point),
+            f"X{x:.3f} Y{y:.3f}",
             feedrate,
         )
         self._position = point
 
+    def _draw_polyline(self, points: Sequence[Point], feedrate: float) -> None:
+        # Same output and timing as calling _linear_move for every point after
+        # the first, which is where the pen already sits, fused into one loop
+        # because this runs for every drawn vertex. Duplicates and motion time
+        # are worked out up front in NumPy.
+        command = self.printer.draw_move_command or "G1"
+        write = self._buffer.write
+        speed_mm_s = feedrate / 60.0
+        deltas = np.diff(np.asarray(points, dtype=np.float64).reshape(-1, 2), axis=0)
+        if speed_mm_s > 0:
+            self._elapsed_time += float(np.hypot(deltas[:, 0], deltas[:, 1]).sum()) / speed_mm_s
+        remaining = list(compress(islice(points, 1, None), np.any(deltas != 0, axis=1).tolist()))
+        for x, y in remaining:
+            if self._feedrate != feedrate:
+                write(f"{command} X{x:.3f} Y{y:.3f} {self._feed_word(feedrate)}\n")
+                self._feedrate = feedrate
+            else:
+                write(f"{command} X{x:.3f} Y{y:.3f}\n")
+        if remaining:
+            self._position = remaining[-1]
+        self._line_count += len(remaining)
+
     def _set_z(self, z: float, feedrate: float) -> None:
         if abs(self._z_height - z) < 1e-6:
             return
         distance = abs(self._z_height - z)
         if self._feedrate != feedrate:
-            self._emit(f"G1 Z{z:.3f} F{feedrate:.0f}")
+            self._emit(f"G1 Z{z:.3f} {self._feed_word(feedrate)}")
             self._feedrate = feedrate
         else:
             self._emit(f"G1 Z{z:.3f}")
@@ -174,8 +223,11 @@ class GcodeGenerator:
     def emit_command(self, line: str) -> None:
         self._emit(line)
 
-    def _toolpath_length(self, points: Polyline) -> float:
-        return sum(_distance(points[index - 1], points[index]) for index in range(1, len(points)))
+    def _toolpath_length(self, toolpath: Toolpath) -> float:
+        if len(toolpath.points) < 2:
+            return 0.0
+        deltas = np.diff(np.asarray(toolpath.points, dtype=np.float64), axis=0)
+        return float(np.hypot(deltas[:, 0], deltas[:, 1]).sum())
 
     def _describe_toolpath(self, toolpath: Toolpath, *, index: int, total: int) -> None:
         if not self.verbose_comments:
@@ -183,20 +235,19 @@ class GcodeGenerator:
         color = toolpath.assigned_color or (
             "#{:02X}{:02X}{:02X}".format(*toolpath.source_color) if toolpath.source_color is not None else "none"
         )
-        points = list(toolpath.points)
         self.emit_comment(
             "TOOLPATH {}/{} tag={} points={} length={:.3f}mm color={}".format(
                 index,
                 total,
                 toolpath.tag,
-                len(points),
-                self._toolpath_length(points),
+                len(toolpath.points),
+                self._toolpath_length(toolpath),
                 color,
             )
         )
 
     def draw_single_toolpath(self, toolpath: Toolpath, feedrates: Feedrates) -> None:
-        points = list(toolpath.points)
+        points = toolpath.points
         if len(points) < 2:
             return
         self._describe_toolpath(toolpath, index=1, total=1)
@@ -210,8 +261,7 @@ class GcodeGenerator:
         self._set_pen_state(False, travel_height, z_feed)
         self._rapid_move(start, travel_feed)
         self._set_pen_state(True, draw_height, z_feed)
-        for point in points[1:]:
-            self._linear_move(point, draw_feed)
+        self._draw_polyline(points, draw_feed)
         self._set_pen_state(False, travel_height, z_feed)
 
     def draw_toolpaths(
@@ -237,7 +287,7 @@ class GcodeGenerator:
         total_paths = len(path_list)
         for index, toolpath in enumerate(path_list):
             self._describe_toolpath(toolpath, index=index + 1, total=total_paths)
-            points = list(toolpath.points)
+            points = toolpath.points
             draw_height = self.printer.z_draw
             travel_height = self.printer.z_raster_travel if toolpath.tag == "raster" else self.printer.z_travel
             start = points[0]
@@ -249,16 +299,15 @@ class GcodeGenerator:
                 self._rapid_move(start, travel_feed)
                 self._set_pen_state(True, draw_height, z_feed)
 
-            for point in points[1:]:
-                self._linear_move(point, draw_feed)
+            # The pen is at ``start`` here, as _draw_polyline expects.
+            self._draw_polyline(points, draw_feed)
 
             next_toolpath = path_list[index + 1] if index + 1 < len(path_list) else None
             if next_toolpath is None:
                 self._set_pen_state(False, travel_height, z_feed)
                 continue
 
-            next_points = list(next_toolpath.points)
-            next_start = next_points[0]
+            next_start = next_toolpath.points[0]
             gap = _distance(points[-1], next_start)
             same_glide_group = (
                 toolpath.glide_group is not None
@@ -282,7 +331,16 @@ class GcodeGenerator:
             self._set_pen_state(False, travel_height, z_feed)
 
     def generate(self) -> List[str]:
-        return self._gcode
+        return self.getvalue().split("\n")[:-1]
+
+    def getvalue(self) -> str:
+        if self._streamed:
+            raise RuntimeError("G-code was streamed to an external writer")
+        return self._buffer.getvalue()
+
+    @property
+    def line_count(self) -> int:
+        return self._line_count
 
     @property
     def elapsed_time_seconds(self) -> float:
@@ -299,17 +357,24 @@ def toolpaths_from_polylines(
     brightness: float | None = None,
     glide_group: str | None = None,
 ) -> List[Toolpath]:
-    return [
-        Toolpath(
-            points=tuple(polyline),
-            tag=tag,
-            source_color=source_color,
-            brightness=brightness,
-            glide_group=glide_group,
+    toolpaths: List[Toolpath] = []
+    for polyline in polylines:
+        if len(polyline) < 2:
+            continue
+        if isinstance(polyline, np.ndarray):
+            points = tuple(map(tuple, polyline.tolist()))
+        else:
+            points = tuple(polyline)
+        toolpaths.append(
+            Toolpath(
+                points=points,
+                tag=tag,
+                source_color=source_color,
+                brightness=brightness,
+                glide_group=glide_group,
+            )
         )
-        for polyline in polylines
-        if len(polyline) >= 2
-    ]
+    return toolpaths
 
 
 def _format_duration(seconds: float) -> str:
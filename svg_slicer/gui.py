@@ -6,15 +6,17 @@ import math
 import os
 import platform
 import sys
-from dataclasses import dataclass, field
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 import yaml
 
 try:
-    from PySide6.QtCore import QPoint, QPointF, QRectF, Qt, Signal, QTimer
-    from PySide6.QtGui import QAction, QColor, QKeySequence, QPainter, QPainterPath, QPen
+    from PySide6.QtCore import QLineF, QPoint, QPointF, QRectF, QSignalBlocker, Qt, Signal, QTimer
+    from PySide6.QtGui import QAction, QBrush, QColor, QKeySequence, QPainter, QPainterPath, QPen, QPolygonF
     from PySide6.QtWidgets import (
         QApplication,
         QFileDialog,
@@ -53,7 +55,8 @@ except ImportError as exc:  # pragma: no cover - GUI dependencies are optional f
         "PySide6 is required to launch the SVG slicer GUI. Install it with `pip install PySide6`."
     ) from exc
 
-from shapely.affinity import rotate as shapely_rotate, scale as shapely_scale, translate as shapely_translate
+import shapely
+from shapely.affinity import translate as shapely_translate
 from shapely.geometry import GeometryCollection, LineString, MultiLineString, MultiPolygon, Polygon
 
 from .artwork_parser import parse_artwork
@@ -66,6 +69,7 @@ from .config import (
     RenderingConfig,
     SamplingConfig,
     SlicerConfig,
+    _HEX_DIGITS,
     load_config,
 )
 from .gcode import Toolpath
@@ -77,6 +81,11 @@ _LOGGER = logging.getLogger(__name__)
 _MIN_FIELD_HEIGHT = 28
 _MAX_UNDO_STATES = 100
 _LAYOUT_FILE_VERSION = 1
+_TRANSFORM_CACHE_SIZE = 8
+_BOUNDS_CACHE_SIZE = 128
+_FOOTPRINT_UPDATE_DELAY_MS = 40
+_LOG_FLUSH_INTERVAL_MS = 50
+_MAX_LOG_LINES = 5000
 _SUPPORTED_ARTWORK_SUFFIXES = {".svg", ".pdf", ".png", ".jpg", ".jpeg", ".bmp", ".webp", ".gif", ".tif", ".tiff"}
 
 
@@ -123,6 +132,11 @@ class LoadedModel:
     bounding_height: float = 0.0
     _origin_offset: Tuple[float, float] = (0.0, 0.0)
     item: Optional["ModelGraphicsItem"] = None
+    _transform_cache: dict = field(default_factory=dict, repr=False, compare=False)
+    _transform_cache_source: Optional[Tuple[Any, float, float]] = field(default=None, repr=False, compare=False)
+    _flat_coords: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    _flat_bounds: Optional[Tuple[float, float, float, float]] = field(default=None, repr=False, compare=False)
+    _bounds_cache: dict = field(default_factory=dict, repr=False, compare=False)
 
     def transformed_shapes(self, *, include_position: bool = True) -> List[ShapeGeometry]:
         geometries, _ = self._compute_transformed_shapes(include_position=include_position)
@@ -191,12 +205,26 @@ class LoadedModel:
             )
 
         if scale is None and rotation is None:
-            self.bounding_width = max(0.0, max_x - min_x)
-            self.bounding_height = max(0.0, max_y - min_y)
-            self._origin_offset = (offset_x, offset_y)
+            self._store_bounds(bounds)
 
         return transformed, bounds
 
+    def refresh_bounds(self) -> None:
+        # Updates bounding_width/height for the current scale and rotation
+        # without building the transformed shapes.
+        _, bounds = self._scaled_rotated_geometries(
+            scale=self._sanitize_scale(None),
+            rotation=self._sanitize_rotation(None),
+            capture_shapes=False,
+        )
+        self._store_bounds(bounds)
+
+    def _store_bounds(self, bounds: Tuple[float, float, float, float]) -> None:
+        min_x, min_y, max_x, max_y = bounds
+        self.bounding_width = max(0.0, max_x - min_x)
+        self.bounding_height = max(0.0, max_y - min_y)
+        self._origin_offset = (-min_x, -min_y)
+
     def _scaled_rotated_geometries(
         self,
         *,
@@ -207,47 +235,77 @@ class LoadedModel:
         Optional[List[Tuple[Any, float, Optional[float], Optional[tuple[int, int, int]], Optional[Any], Optional[str], Optional[str]]]],
         Tuple[float, float, float, float],
     ]:
+        # Scaled/rotated geometry only depends on the normalized shapes, so reuse it
+        # until those are replaced; position is applied by the caller.
+        source = (self.normalized_shapes, self.width, self.height)
+        cached_source = self._transform_cache_source
+        if (
+            cached_source is None
+            or cached_source[0] is not source[0]
+            or cached_source[1:] != source[1:]
+        ):
+            self._transform_cache.clear()
+            self._bounds_cache.clear()
+            self._transform_cache_source = source
+            self._flat_coords = None
+            self._flat_bounds = None
+        cache_key = (scale, rotation)
+        cached = self._transform_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if not capture_shapes:
+            cached_bounds = self._bounds_cache.get(cache_key)
+            if cached_bounds is not None:
+                return None, cached_bounds
+
         staged: Optional[List[Tuple[Any, float, Optional[float], Optional[tuple[int, int, int]], Optional[Any], Optional[str], Optional[str]]]] = (
             [] if capture_shapes else None
         )
 
-        min_x = math.inf
-        min_y = math.inf
-        max_x = -math.inf
-        max_y = -math.inf
-
         # Determine rotation origin in scaled coordinates if possible.
         origin_x = self.width * scale / 2.0 if self.width else 0.0
         origin_y = self.height * scale / 2.0 if self.height else 0.0
-        origin = (origin_x, origin_y)
         rotate_needed = not math.isclose(rotation % 360.0, 0.0, abs_tol=1e-7)
+        transform = _scale_rotate_transform(scale, rotation if rotate_needed else None, (origin_x, origin_y))
+        identity = scale == 1.0 and not rotate_needed
+
+        shapes = self.normalized_shapes
+        count = len(shapes)
+        if not capture_shapes:
+            # Footprint queries only need bounds, so transform one flat
+            # coordinate block instead of rebuilding every geometry.
+            coords = self._flat_coords
+            if coords is None:
+                coords = self._flat_coords = shapely.get_coordinates([shape.geometry for shape in shapes])
+                if len(coords):
+                    self._flat_bounds = (*coords.min(axis=0).tolist(), *coords.max(axis=0).tolist())
+            if not len(coords):
+                min_x = min_y = max_x = max_y = 0.0
+            elif not rotate_needed:
+                # Scaling about the origin keeps the extreme coordinates extreme,
+                # so the unrotated footprint is just the scaled normalized bounds.
+                min_x, min_y, max_x, max_y = (value * scale for value in self._flat_bounds)
+            else:
+                transformed_coords = transform(coords)
+                min_x, min_y = transformed_coords.min(axis=0).tolist()
+                max_x, max_y = transformed_coords.max(axis=0).tolist()
+            geometries = np.empty(0, dtype=object)
+        else:
+            geometries = np.empty(count * 2, dtype=object)
+            geometries[:count] = [shape.geometry for shape in shapes]
+            geometries[count:] = [shape.centerline_geometry for shape in shapes]
+            if not identity:
+                geometries = shapely.transform(geometries, transform)
+
+            bounds = shapely.bounds(geometries[:count])
+            if count and not np.isnan(bounds).all():
+                min_x, min_y = np.nanmin(bounds[:, :2], axis=0).tolist()
+                max_x, max_y = np.nanmax(bounds[:, 2:], axis=0).tolist()
+            else:
+                min_x = min_y = max_x = max_y = 0.0
 
-        for shape in self.normalized_shapes:
-            geom = shapely_scale(shape.geometry, xfact=scale, yfact=scale, origin=(0, 0))
-            centerline_geometry = shape.centerline_geometry
-            if centerline_geometry is not None:
-                centerline_geometry = shapely_scale(
-                    centerline_geometry,
-                    xfact=scale,
-                    yfact=scale,
-                    origin=(0, 0),
-                )
-            if rotate_needed:
-                geom = shapely_rotate(geom, rotation, origin=origin, use_radians=False)
-                if centerline_geometry is not None:
-                    centerline_geometry = shapely_rotate(
-                        centerline_geometry,
-                        rotation,
-                        origin=origin,
-                        use_radians=False,
-                    )
-            if not geom.is_empty:
-                bounds = geom.bounds
-                min_x = min(min_x, bounds[0])
-                min_y = min(min_y, bounds[1])
-                max_x = max(max_x, bounds[2])
-                max_y = max(max_y, bounds[3])
-            if capture_shapes and staged is not None:
+        if capture_shapes and staged is not None:
+            for shape, geom, centerline_geometry in zip(shapes, geometries[:count], geometries[count:]):
                 staged.append(
                     (
                         geom,
@@ -260,10 +318,18 @@ class LoadedModel:
                     )
                 )
 
-        if min_x is math.inf or min_y is math.inf or max_x is -math.inf or max_y is -math.inf:
-            min_x = min_y = max_x = max_y = 0.0
-
-        return staged, (min_x, min_y, max_x, max_y)
+        bounds = (min_x, min_y, max_x, max_y)
+        if not capture_shapes:
+            # Footprint lookups are tiny, so spin-box scrubbing can keep many of them.
+            if len(self._bounds_cache) >= _BOUNDS_CACHE_SIZE:
+                del self._bounds_cache[next(iter(self._bounds_cache))]
+            self._bounds_cache[cache_key] = bounds
+            return None, bounds
+        if len(self._transform_cache) >= _TRANSFORM_CACHE_SIZE:
+            self._transform_cache.clear()
+        result = (staged, bounds)
+        self._transform_cache[cache_key] = result
+        return result
 
     def _sanitize_scale(self, scale: Optional[float]) -> float:
         value = self.scale if scale is None else scale
@@ -275,29 +341,58 @@ class LoadedModel:
         return rotation
 
 
-def _add_polygon_to_path(path: QPainterPath, polygon: Polygon) -> None:
-    exterior = list(polygon.exterior.coords)
-    if len(exterior) >= 2:
-        path.moveTo(exterior[0][0], exterior[0][1])
-        for x, y in exterior[1:]:
-            path.lineTo(x, y)
+def _scale_rotate_transform(
+    scale: float,
+    rotation: Optional[float],
+    origin: Tuple[float, float],
+) -> Callable[[np.ndarray], np.ndarray]:
+    # Same arithmetic as shapely.affinity.scale about (0, 0) followed by
+    # shapely.affinity.rotate about ``origin``, applied to a whole coordinate block.
+    if rotation is None:
+        return lambda coords: coords * scale
+    radians = math.radians(rotation)
+    cos_r = math.cos(radians)
+    sin_r = math.sin(radians)
+    if abs(cos_r) < 2.5e-16:
+        cos_r = 0.0
+    if abs(sin_r) < 2.5e-16:
+        sin_r = 0.0
+    origin_x, origin_y = origin
+    x_off = origin_x - origin_x * cos_r + origin_y * sin_r
+    y_off = origin_y - origin_x * sin_r - origin_y * cos_r
+
+    def _apply(coords: np.ndarray) -> np.ndarray:
+        scaled = coords * scale
+        x = scaled[:, 0]
+        y = scaled[:, 1]
+        return np.column_stack((cos_r * x - sin_r * y + x_off, sin_r * x + cos_r * y + y_off))
+
+    return _apply
+
+
+def _coords_to_polygon(coords: np.ndarray) -> QPolygonF:
+    xs, ys = coords.T.tolist()
+    return QPolygonF(list(map(QPointF, xs, ys)))
+
+
+def _add_ring_to_path(path: QPainterPath, ring) -> None:  # type: ignore[no-untyped-def]
+    coords = shapely.get_coordinates(ring)
+    if len(coords) >= 2:
+        path.addPolygon(_coords_to_polygon(coords))
         path.closeSubpath()
+
+
+def _add_polygon_to_path(path: QPainterPath, polygon: Polygon) -> None:
+    _add_ring_to_path(path, polygon.exterior)
     for interior in polygon.interiors:
-        coords = list(interior.coords)
-        if len(coords) >= 2:
-            path.moveTo(coords[0][0], coords[0][1])
-            for x, y in coords[1:]:
-                path.lineTo(x, y)
-            path.closeSubpath()
+        _add_ring_to_path(path, interior)
 
 
 def _add_line_to_path(path: QPainterPath, line: LineString) -> None:
-    coords = list(line.coords)
+    coords = shapely.get_coordinates(line)
     if len(coords) < 2:
         return
-    path.moveTo(coords[0][0], coords[0][1])
-    for x, y in coords[1:]:
-        path.lineTo(x, y)
+    path.addPolygon(_coords_to_polygon(coords))
 
 
 def _geometry_to_path(path: QPainterPath, geometry) -> None:  # type: ignore[no-untyped-def]
@@ -322,18 +417,22 @@ def _clamp(value: float, *, lower: float = 0.0, upper: float = 1.0) -> float:
     return min(max(value, lower), upper)
 
 
+# Shared, read-only greys for brightness-shaded toolpaths; callers must not mutate them.
+_GRAY_COLORS = tuple(QColor(gray, gray, gray) for gray in range(256))
+
+
 def _brightness_to_gray(brightness: float | None) -> int:
     if brightness is None:
         return 150
     return int(round(_clamp(brightness) * 255))
 
 
-def _shape_to_qcolor(shape: ShapeGeometry) -> QColor:
+def _shape_color_key(shape: ShapeGeometry) -> tuple[int, int, int]:
     if shape.color is not None:
         r, g, b = shape.color
-        return QColor(int(r), int(g), int(b))
+        return int(r), int(g), int(b)
     gray = _brightness_to_gray(shape.brightness)
-    return QColor(gray, gray, gray)
+    return gray, gray, gray
 
 
 def _toolpath_to_qcolor(toolpath: Toolpath) -> QColor:
@@ -344,18 +443,18 @@ def _toolpath_to_qcolor(toolpath: Toolpath) -> QColor:
     if toolpath.source_color is not None:
         r, g, b = toolpath.source_color
         return QColor(int(r), int(g), int(b))
-    gray = _brightness_to_gray(toolpath.brightness)
-    return QColor(gray, gray, gray)
+    return _GRAY_COLORS[_brightness_to_gray(toolpath.brightness)]
 
 
 def _mirror_toolpaths_for_printer(toolpaths: Iterable[Toolpath], printer: PrinterConfig) -> List[Toolpath]:
     y_sum = printer.y_min + printer.y_max
     mirrored: List[Toolpath] = []
     for toolpath in toolpaths:
-        mirrored_points = tuple((x, y_sum - y) for x, y in toolpath.points)
+        mirrored_array = toolpath.points_array
+        mirrored_array[:, 1] = y_sum - mirrored_array[:, 1]
         mirrored.append(
             Toolpath(
-                points=mirrored_points,
+                points=tuple(map(tuple, mirrored_array.tolist())),
                 tag=toolpath.tag,
                 source_color=toolpath.source_color,
                 assigned_color=toolpath.assigned_color,
@@ -366,13 +465,6 @@ def _mirror_toolpaths_for_printer(toolpaths: Iterable[Toolpath], printer: Printe
     return mirrored
 
 
-def build_model_path(shapes: Sequence[ShapeGeometry]) -> QPainterPath:
-    painter_path = QPainterPath()
-    for shape in shapes:
-        _geometry_to_path(painter_path, shape.geometry)
-    return painter_path
-
-
 class ModelGraphicsItem(QGraphicsPathItem):
     """Graphics item representing an artwork model positioned on the build plate."""
 
@@ -388,7 +480,10 @@ class ModelGraphicsItem(QGraphicsPathItem):
         self._bed_rect = bed_rect
         self._moved_callback = moved_callback
         self._drag_finished_callback = drag_finished_callback
-        self._color_paths: List[tuple[QColor, QPainterPath]] = []
+        self._color_paths: List[tuple[QPen, QBrush, QPainterPath]] = []
+        self._path_cache_key: Optional[Tuple[Any, float, float, float, float]] = None
+        # Clamp bounds for itemChange(); reset whenever the bed rect or path changes.
+        self._position_limits: Optional[Tuple[float, float, float, float, float, float]] = None
         self._drag_start_position: Optional[Tuple[float, float]] = None
 
         self.setFlags(
@@ -405,28 +500,48 @@ class ModelGraphicsItem(QGraphicsPathItem):
         self.setPos(model.position[0], model.position[1])
 
     def refresh_path(self) -> None:
-        shapes = self.model.display_shapes()
-        color_paths: dict[tuple[int, int, int, int], QPainterPath] = {}
-
-        for shape in shapes:
-            if shape.geometry.is_empty:
+        model = self.model
+        # Paths are drawn in model-local coordinates, so only a new shape set,
+        # scale or rotation needs a rebuild; position is handled by setPos().
+        cache_key = (model.normalized_shapes, model.width, model.height, model.scale, model.rotation_degrees)
+        previous_key = self._path_cache_key
+        if previous_key is not None and previous_key[0] is cache_key[0] and previous_key[1:] == cache_key[1:]:
+            return
+        self._path_cache_key = cache_key
+
+        shapes = model.display_shapes()
+        color_paths: defaultdict[tuple[int, int, int], QPainterPath] = defaultdict(QPainterPath)
+        painter_path = QPainterPath()
+
+        empty_flags = shapely.is_empty([shape.geometry for shape in shapes]).tolist()
+        for shape, is_empty in zip(shapes, empty_flags):
+            if is_empty:
                 continue
             shape_path = QPainterPath()
             _geometry_to_path(shape_path, shape.geometry)
             if shape_path.isEmpty():
                 continue
-            qcolor = _shape_to_qcolor(shape)
-            key = (qcolor.red(), qcolor.green(), qcolor.blue(), qcolor.alpha())
-            color_paths.setdefault(key, QPainterPath()).addPath(shape_path)
+            color_paths[_shape_color_key(shape)].addPath(shape_path)
+            painter_path.addPath(shape_path)
 
-        self._color_paths = [(QColor(r, g, b, a), path) for (r, g, b, a), path in color_paths.items()]
+        # Pens and brushes are built here so paint() only has to set them.
+        styled_paths: List[tuple[QPen, QBrush, QPainterPath]] = []
+        for (r, g, b), path in color_paths.items():
+            pen = QPen(QColor(r, g, b))
+            pen.setWidthF(0)
+            pen.setCosmetic(True)
+            brush_color = QColor(r, g, b)
+            brush_color.setAlpha(60)
+            styled_paths.append((pen, QBrush(brush_color), path))
+        self._color_paths = styled_paths
 
-        painter_path = build_model_path(shapes)
         self.setPath(painter_path)
+        self._position_limits = None
         self.update()
 
     def set_bed_rect(self, bed_rect: QRectF) -> None:
         self._bed_rect = bed_rect
+        self._position_limits = None
 
     def paint(self, painter, option: QStyleOptionGraphicsItem, widget=None) -> None:  # type: ignore[override]
         if not self._color_paths:
@@ -434,15 +549,9 @@ class ModelGraphicsItem(QGraphicsPathItem):
             return
 
         painter.save()
-        for color, path in self._color_paths:
-            pen = QPen(color)
-            pen.setWidthF(0)
-            pen.setCosmetic(True)
+        for pen, brush, path in self._color_paths:
             painter.setPen(pen)
-
-            brush_color = QColor(color)
-            brush_color.setAlpha(60)
-            painter.setBrush(brush_color)
+            painter.setBrush(brush)
             painter.drawPath(path)
 
         if option.state & QStyle.State_Selected:
@@ -464,19 +573,12 @@ class ModelGraphicsItem(QGraphicsPathItem):
                 new_pos = value.toPointF()
             else:
                 new_pos = QPointF(value)
-            rect = self.boundingRect()
-            min_x = self._bed_rect.left()
-            min_y = self._bed_rect.top()
-            max_x = self._bed_rect.right() - rect.width()
-            max_y = self._bed_rect.bottom() - rect.height()
-            if max_x < min_x:
-                x = (self._bed_rect.left() + self._bed_rect.right() - rect.width()) / 2.0
-            else:
-                x = min(max(new_pos.x(), min_x), max_x)
-            if max_y < min_y:
-                y = (self._bed_rect.top() + self._bed_rect.bottom() - rect.height()) / 2.0
-            else:
-                y = min(max(new_pos.y(), min_y), max_y)
+            limits = self._position_limits
+            if limits is None:
+                limits = self._position_limits = self._compute_position_limits()
+            min_x, min_y, max_x, max_y, center_x, center_y = limits
+            x = center_x if max_x < min_x else min(max(new_pos.x(), min_x), max_x)
+            y = center_y if max_y < min_y else min(max(new_pos.y(), min_y), max_y)
             return QPointF(x, y)
         if change == QGraphicsItem.ItemPositionHasChanged:
             pos = self.pos()
@@ -485,6 +587,18 @@ class ModelGraphicsItem(QGraphicsPathItem):
                 self._moved_callback(self.model)
         return super().itemChange(change, value)
 
+    def _compute_position_limits(self) -> Tuple[float, float, float, float, float, float]:
+        rect = self.boundingRect()
+        bed = self._bed_rect
+        return (
+            bed.left(),
+            bed.top(),
+            bed.right() - rect.width(),
+            bed.bottom() - rect.height(),
+            (bed.left() + bed.right() - rect.width()) / 2.0,
+            (bed.top() + bed.bottom() - rect.height()) / 2.0,
+        )
+
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
         if event.button() == Qt.LeftButton:
             self._drag_start_position = self.model.position
@@ -548,7 +662,12 @@ class BuildPlateView(QGraphicsView):
 
         self._printer: PrinterConfig | None = None
         self._bed_rect = QRectF()
+        self._grid_pen = QPen(QColor("#d0d0d0"))
+        self._grid_pen.setWidthF(0)
+        self._grid_pen.setCosmetic(True)
+        self._grid_lines: List[QLineF] = []
         self._toolpath_items: List[QGraphicsPathItem] = []
+        self._arrangement_changed = False
         self._model_items: List[ModelGraphicsItem] = []
         self._suppress_selection_signal = False
         self._refit_pending = False
@@ -580,23 +699,23 @@ class BuildPlateView(QGraphicsView):
         self._bed_item = self._scene.addRect(rect, bed_pen, QColor("#ffffff"))
         self._bed_item.setZValue(-2)
 
-        grid_pen = QPen(QColor("#d0d0d0"))
-        grid_pen.setWidthF(0)
-        grid_pen.setCosmetic(True)
         spacing_candidates = [printer.printable_width, printer.printable_depth]
         grid_spacing = max(value for value in spacing_candidates if value > 0) / 10.0 if any(
             value > 0 for value in spacing_candidates
         ) else 10.0
+        # The grid is painted in drawBackground() rather than kept as scene items.
+        grid_lines: List[QLineF] = []
         x = printer.x_min
         while x <= printer.x_max:
-            line = self._scene.addLine(x, printer.y_min, x, printer.y_max, grid_pen)
-            line.setZValue(-3)
+            grid_lines.append(QLineF(x, printer.y_min, x, printer.y_max))
             x += grid_spacing
         y = printer.y_min
         while y <= printer.y_max:
-            line = self._scene.addLine(printer.x_min, y, printer.x_max, y, grid_pen)
-            line.setZValue(-3)
+            grid_lines.append(QLineF(printer.x_min, y, printer.x_max, y))
             y += grid_spacing
+        self._grid_lines = grid_lines
+        self.resetCachedContent()
+        self.viewport().update()
 
         self._info_item = self._scene.addText("Drop SVG, PDF, or image files onto the build plate")
         self._info_item.setTextWidth(max(rect.width() * 0.9, 1.0))
@@ -607,6 +726,15 @@ class BuildPlateView(QGraphicsView):
         self._manual_navigation = False
         self._schedule_refit(force=True)
 
+    def drawBackground(self, painter: QPainter, rect: QRectF) -> None:  # type: ignore[override]
+        super().drawBackground(painter, rect)
+        if not self._grid_lines:
+            return
+        painter.save()
+        painter.setPen(self._grid_pen)
+        painter.drawLines(self._grid_lines)
+        painter.restore()
+
     def reset_models(self, models: Sequence[LoadedModel]) -> None:
         self.clear_models()
         for model in models:
@@ -650,16 +778,21 @@ class BuildPlateView(QGraphicsView):
 
     def update_toolpaths(self, toolpaths: Iterable[Toolpath]) -> None:
         self.clear_toolpaths()
+        self._arrangement_changed = False
 
+        # One scene item per colour keeps the scene small for large slices.
+        color_paths: dict[int, tuple[QColor, QPainterPath]] = {}
         for toolpath in toolpaths:
-            points = list(toolpath.points)
-            if len(points) < 2:
+            if len(toolpath.points) < 2:
                 continue
-            painter_path = QPainterPath()
-            painter_path.moveTo(points[0][0], points[0][1])
-            for x, y in points[1:]:
-                painter_path.lineTo(x, y)
+            coords = toolpath.points_array
             color = _toolpath_to_qcolor(toolpath)
+            entry = color_paths.get(color.rgba())
+            if entry is None:
+                entry = color_paths[color.rgba()] = (color, QPainterPath())
+            entry[1].addPolygon(_coords_to_polygon(coords))
+
+        for color, painter_path in color_paths.values():
             pen = QPen(color)
             pen.setWidthF(0)
             pen.setCosmetic(True)
@@ -795,10 +928,12 @@ class BuildPlateView(QGraphicsView):
         self.fitInView(rect, Qt.KeepAspectRatio)
 
     def _on_model_moved(self, model: LoadedModel) -> None:
-        for item in self._model_items:
-            item.set_bed_rect(self._bed_rect)
-        self.clear_toolpaths()
-        self.arrangementChanged.emit()
+        # Drags report every intermediate position; the toolpaths only need
+        # clearing (and listeners notifying) once until new ones are shown.
+        if self._toolpath_items or not self._arrangement_changed:
+            self._arrangement_changed = True
+            self.clear_toolpaths()
+            self.arrangementChanged.emit()
         self._update_info_visibility()
 
     def _on_model_drag_finished(
@@ -871,6 +1006,11 @@ class PrepareTab(QWidget):
         self._current_model: Optional[LoadedModel] = None
         self._updating_dimension_spins = False
         self._last_dimension_edit: Optional[str] = None
+        # Coalesces footprint recomputation while the scale/rotation spins are scrubbed.
+        self._footprint_update_timer = QTimer(self)
+        self._footprint_update_timer.setSingleShot(True)
+        self._footprint_update_timer.setInterval(_FOOTPRINT_UPDATE_DELAY_MS)
+        self._footprint_update_timer.timeout.connect(self._refresh_pending_footprint)
 
         self.printer_label = QLabel("Printer: —")
         self.scale_label = QLabel("Models: 0")
@@ -878,6 +1018,7 @@ class PrepareTab(QWidget):
 
         self.file_list = QListWidget()
         self.file_list.setSelectionMode(QListWidget.ExtendedSelection)
+        self._listed_rows: List[Tuple[str, str]] = []
         self.file_list.setMinimumWidth(220)
 
         self.add_button = QPushButton("Add Artwork…")
@@ -1046,19 +1187,32 @@ class PrepareTab(QWidget):
         self.build_plate.clear_toolpaths()
 
     def refresh_models(self, models: Sequence[LoadedModel], selected_index: Optional[int] = None) -> None:
-        self.file_list.clear()
+        rows: List[Tuple[str, str]] = []
         for model in models:
             label = model.path.name
             if model.path.suffix.lower() == ".pdf":
                 label = f"{model.path.name} (page {model.pdf_page})"
-            item = QListWidgetItem(label)
-            item.setData(Qt.UserRole, str(model.path))
-            item.setToolTip(str(model.path))
-            self.file_list.addItem(item)
+            rows.append((label, str(model.path)))
         self.scale_label.setText(f"Models: {len(models)}")
 
         self._ignore_list_signal = True
         try:
+            # Only rows after the first difference are replaced, so adding or
+            # removing the last model (or no change at all) leaves the rest alone.
+            unchanged = 0
+            for listed_row, row in zip(self._listed_rows, rows):
+                if listed_row != row:
+                    break
+                unchanged += 1
+            for index in range(self.file_list.count() - 1, unchanged - 1, -1):
+                self.file_list.takeItem(index)
+            for label, path in rows[unchanged:]:
+                item = QListWidgetItem(label)
+                item.setData(Qt.UserRole, path)
+                item.setToolTip(path)
+                self.file_list.addItem(item)
+            self._listed_rows = rows
+
             if selected_index is not None and 0 <= selected_index < len(models):
                 self.file_list.setCurrentRow(selected_index)
             else:
@@ -1083,6 +1237,7 @@ class PrepareTab(QWidget):
             self._ignore_list_signal = False
 
     def update_scale_controls(self, model: Optional[LoadedModel], pending_scale: Optional[float] = None) -> None:
+        self._footprint_update_timer.stop()
         self._current_model = model
         self._last_dimension_edit = None
         if not model:
@@ -1095,30 +1250,26 @@ class PrepareTab(QWidget):
             self.footprint_width_spin.setEnabled(False)
             self.footprint_height_spin.setEnabled(False)
             self.footprint_apply_button.setEnabled(False)
-            self.scale_spin.blockSignals(True)
-            self.scale_spin.setValue(100.0)
-            self.scale_spin.blockSignals(False)
-            self.rotation_spin.blockSignals(True)
-            self.rotation_spin.setValue(0.0)
-            self.rotation_spin.blockSignals(False)
+            with QSignalBlocker(self.scale_spin):
+                self.scale_spin.setValue(100.0)
+            with QSignalBlocker(self.rotation_spin):
+                self.rotation_spin.setValue(0.0)
             self._set_footprint_spins(0.0, 0.0)
             return
 
         scale_value = pending_scale if pending_scale is not None else model.scale
         rotation_value = model.rotation_degrees
 
-        self.scale_spin.blockSignals(True)
-        self.scale_spin.setEnabled(True)
-        self.scale_spin.setValue(scale_value * 100.0)
-        self.scale_spin.blockSignals(False)
+        with QSignalBlocker(self.scale_spin):
+            self.scale_spin.setEnabled(True)
+            self.scale_spin.setValue(scale_value * 100.0)
 
         self.scale_apply_button.setEnabled(True)
         self.scale_reset_button.setEnabled(True)
 
-        self.rotation_spin.blockSignals(True)
-        self.rotation_spin.setEnabled(True)
-        self.rotation_spin.setValue(rotation_value)
-        self.rotation_spin.blockSignals(False)
+        with QSignalBlocker(self.rotation_spin):
+            self.rotation_spin.setEnabled(True)
+            self.rotation_spin.setValue(rotation_value)
 
         self.rotation_apply_button.setEnabled(True)
         self.rotation_reset_button.setEnabled(True)
@@ -1144,8 +1295,7 @@ class PrepareTab(QWidget):
     def _on_scale_value_changed(self, value: float) -> None:
         if not self.scale_spin.isEnabled() or not self._current_model:
             return
-        scale_value = value / 100.0
-        self._update_footprint_for_scale(scale_value)
+        self._footprint_update_timer.start()
 
     def _emit_rotation_apply(self) -> None:
         if not self.rotation_spin.isEnabled():
@@ -1155,20 +1305,22 @@ class PrepareTab(QWidget):
     def _on_rotation_value_changed(self, value: float) -> None:
         if not self.rotation_spin.isEnabled() or not self._current_model:
             return
-        scale_value = self.scale_spin.value() / 100.0
-        self._update_footprint_for_scale(scale_value)
+        self._footprint_update_timer.start()
+
+    def _refresh_pending_footprint(self) -> None:
+        if not self.scale_spin.isEnabled() or not self._current_model:
+            return
+        self._update_footprint_for_scale(self.scale_spin.value() / 100.0)
 
     def _set_footprint_spins(self, width: float, height: float) -> None:
         self._updating_dimension_spins = True
         try:
             safe_width = max(width, 0.001) if width > 0 else 0.001
             safe_height = max(height, 0.001) if height > 0 else 0.001
-            self.footprint_width_spin.blockSignals(True)
-            self.footprint_width_spin.setValue(safe_width)
-            self.footprint_width_spin.blockSignals(False)
-            self.footprint_height_spin.blockSignals(True)
-            self.footprint_height_spin.setValue(safe_height)
-            self.footprint_height_spin.blockSignals(False)
+            with QSignalBlocker(self.footprint_width_spin):
+                self.footprint_width_spin.setValue(safe_width)
+            with QSignalBlocker(self.footprint_height_spin):
+                self.footprint_height_spin.setValue(safe_height)
         finally:
             self._updating_dimension_spins = False
 
@@ -1199,9 +1351,8 @@ class PrepareTab(QWidget):
         if scale_value is None:
             return
         self._last_dimension_edit = source
-        self.scale_spin.blockSignals(True)
-        self.scale_spin.setValue(scale_value * 100.0)
-        self.scale_spin.blockSignals(False)
+        with QSignalBlocker(self.scale_spin):
+            self.scale_spin.setValue(scale_value * 100.0)
         self._update_footprint_for_scale(scale_value)
 
     def _on_footprint_width_changed(self, value: float) -> None:
@@ -1516,22 +1667,28 @@ class SettingsTab(QWidget):
         widget.setMinimumHeight(max(hint_height, _MIN_FIELD_HEIGHT))
 
     def set_config(self, config: SlicerConfig, profiles: List[str], current_profile: Optional[str]) -> None:
+        self.setUpdatesEnabled(False)
+        try:
+            self._fill_fields(config, profiles, current_profile)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _fill_fields(self, config: SlicerConfig, profiles: List[str], current_profile: Optional[str]) -> None:
         self._config = config
         self._updating_fields = True
 
-        self.profile_combo.blockSignals(True)
-        self.profile_combo.clear()
-        if profiles:
-            self.profile_combo.addItems(profiles)
-            if current_profile and current_profile in profiles:
-                index = profiles.index(current_profile)
-                self.profile_combo.setCurrentIndex(index)
+        with QSignalBlocker(self.profile_combo):
+            self.profile_combo.clear()
+            if profiles:
+                self.profile_combo.addItems(profiles)
+                if current_profile and current_profile in profiles:
+                    index = profiles.index(current_profile)
+                    self.profile_combo.setCurrentIndex(index)
+                else:
+                    self.profile_combo.setCurrentIndex(0)
+                self.profile_combo.setVisible(True)
             else:
-                self.profile_combo.setCurrentIndex(0)
-            self.profile_combo.setVisible(True)
-        else:
-            self.profile_combo.setVisible(False)
-        self.profile_combo.blockSignals(False)
+                self.profile_combo.setVisible(False)
 
         printer = config.printer
         self.printer_name_edit.setText(printer.name)
@@ -1720,7 +1877,7 @@ class SettingsTab(QWidget):
             if not chunk:
                 continue
             value = chunk[1:] if chunk.startswith("#") else chunk
-            if len(value) != 6 or any(c not in "0123456789abcdefABCDEF" for c in value):
+            if len(value) != 6 or not _HEX_DIGITS.issuperset(value):
                 raise ValueError(f"Invalid hex color '{chunk}'. Expected format like #RRGGBB.")
             entries.append(f"#{value.upper()}")
         return entries
@@ -1742,6 +1899,9 @@ class SettingsTab(QWidget):
         except Exception as exc:
             QMessageBox.critical(self, "Invalid Settings", f"Could not apply settings:\n{exc}")
             return
+        if config == self._config:
+            # Nothing changed; skip the model reconfiguration that applying triggers.
+            return
         self._config = config
         self.configApplied.emit(config)
 
@@ -1765,6 +1925,8 @@ class SettingsTab(QWidget):
 class MainWindow(QMainWindow):
     """Main GUI window that orchestrates slicing and configuration."""
 
+    _logRecordReceived = Signal(str)
+
     def __init__(self, config_path: Path, profile: Optional[str] = None) -> None:
         super().__init__()
         self.setWindowTitle("SVG Slicer")
@@ -1800,7 +1962,7 @@ class MainWindow(QMainWindow):
         self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
         self.log_output.setPlaceholderText("Log output will appear here.")
-        self.log_output.setMaximumBlockCount(5000)
+        self.log_output.setMaximumBlockCount(_MAX_LOG_LINES)
         self.log_output.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.log_output.setMinimumHeight(80)
         self._main_splitter.addWidget(self.log_output)
@@ -1812,7 +1974,17 @@ class MainWindow(QMainWindow):
 
         self.statusBar().showMessage("Ready")
 
-        self._log_handler = GuiLogHandler(self._append_log)
+        # Log lines are queued and appended in batches so bursts of records cost
+        # one document update instead of one per line.
+        self._log_buffer: deque[str] = deque(maxlen=_MAX_LOG_LINES)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(_LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
+        # Records can come from any thread; the queued signal hands them to the
+        # GUI thread so the buffer and timer are only touched there.
+        self._logRecordReceived.connect(self._append_log, Qt.QueuedConnection)
+        self._log_handler = GuiLogHandler(self._logRecordReceived.emit)
         logging.getLogger().addHandler(self._log_handler)
         logging.getLogger().setLevel(logging.INFO)
 
@@ -1888,7 +2060,15 @@ class MainWindow(QMainWindow):
         self.settings_tab.profileSelected.connect(self._switch_profile)
 
     def _append_log(self, message: str) -> None:
-        self.log_output.appendPlainText(message)
+        self._log_buffer.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_logs(self) -> None:
+        if not self._log_buffer:
+            return
+        self.log_output.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
 
     def _start_progress_dialog(
         self,
@@ -2111,52 +2291,29 @@ class MainWindow(QMainWindow):
     def _normalize_shapes(shapes: Sequence[ShapeGeometry]) -> Tuple[List[ShapeGeometry], float, float]:
         if not shapes:
             return [], 0.0, 0.0
-        bounds = [shape.geometry.bounds for shape in shapes if not shape.geometry.is_empty]
-        if not bounds:
-            normalized = [
-                ShapeGeometry(
-                    geometry=shape.geometry,
-                    brightness=shape.brightness,
-                    stroke_width=shape.stroke_width,
-                    color=shape.color,
-                    centerline_geometry=shape.centerline_geometry,
-                    toolpath_tag=shape.toolpath_tag,
-                    toolpath_group=shape.toolpath_group,
-                )
-                for shape in shapes
-            ]
-            return normalized, 0.0, 0.0
-
-        min_x = min(bound[0] for bound in bounds)
-        min_y = min(bound[1] for bound in bounds)
-        max_x = max(bound[2] for bound in bounds)
-        max_y = max(bound[3] for bound in bounds)
+        count = len(shapes)
+        geometries = np.empty(count * 2, dtype=object)
+        geometries[:count] = [shape.geometry for shape in shapes]
+        geometries[count:] = [shape.centerline_geometry for shape in shapes]
+
+        bounds = shapely.bounds(geometries[:count])
+        if np.isnan(bounds).all():
+            return list(shapes), 0.0, 0.0
+
+        min_x, min_y = np.nanmin(bounds[:, :2], axis=0).tolist()
+        max_x, max_y = np.nanmax(bounds[:, 2:], axis=0).tolist()
         width = max(0.0, max_x - min_x)
         height = max(0.0, max_y - min_y)
 
-        normalized_shapes: List[ShapeGeometry] = []
-        for shape in shapes:
-            geom = shape.geometry
-            centerline_geometry = shape.centerline_geometry
-            if not geom.is_empty:
-                geom = shapely_translate(geom, xoff=-min_x, yoff=-min_y)
-            if centerline_geometry is not None and not centerline_geometry.is_empty:
-                centerline_geometry = shapely_translate(
-                    centerline_geometry,
-                    xoff=-min_x,
-                    yoff=-min_y,
-                )
-            normalized_shapes.append(
-                ShapeGeometry(
-                    geometry=geom,
-                    brightness=shape.brightness,
-                    stroke_width=shape.stroke_width,
-                    color=shape.color,
-                    centerline_geometry=centerline_geometry,
-                    toolpath_tag=shape.toolpath_tag,
-                    toolpath_group=shape.toolpath_group,
-                )
-            )
+        if min_x == 0.0 and min_y == 0.0:
+            # Already at the origin; shapes are never mutated, so share them.
+            return list(shapes), width, height
+        offset = np.array([-min_x, -min_y])
+        geometries = shapely.transform(geometries, lambda coords: coords + offset)
+        normalized_shapes = [
+            replace(shape, geometry=geometry, centerline_geometry=centerline_geometry)
+            for shape, geometry, centerline_geometry in zip(shapes, geometries[:count], geometries[count:])
+        ]
         return normalized_shapes, width, height
 
     def _configure_model_for_printer(
@@ -2185,7 +2342,7 @@ class MainWindow(QMainWindow):
         max_scale = max(max_scale, 1e-6)
 
         if preserve_position:
-            model.display_shapes()
+            model.refresh_bounds()
             model.initial_scale = max_scale
             current_scale = model.scale if model.scale > 0 else max_scale
             new_scale = min(max(current_scale, 1e-6), max_scale if scale_candidates else current_scale)
@@ -2196,7 +2353,7 @@ class MainWindow(QMainWindow):
             centre_y = model.position[1] + (previous_height / 2.0 if previous_height > 0 else 0.0)
 
             model.scale = new_scale
-            model.display_shapes()
+            model.refresh_bounds()
             scaled_width = model.bounding_width if model.bounding_width > 0 else model.width * model.scale
             scaled_height = model.bounding_height if model.bounding_height > 0 else model.height * model.scale
 
@@ -2208,7 +2365,7 @@ class MainWindow(QMainWindow):
         else:
             model.scale = max_scale
             model.initial_scale = max_scale
-            model.display_shapes()
+            model.refresh_bounds()
             scaled_width = model.bounding_width if model.bounding_width > 0 else model.width * model.scale
             scaled_height = model.bounding_height if model.bounding_height > 0 else model.height * model.scale
 
@@ -2228,12 +2385,19 @@ class MainWindow(QMainWindow):
         progress_update: Optional[Callable[[str], None]] = None,
     ) -> None:
         total_models = len(self.models)
-        for idx, model in enumerate(self.models):
-            if progress_update:
-                progress_update(f"Reconfiguring models ({idx + 1}/{total_models})…")
-            self._configure_model_for_printer(model, preserve_position=preserve_positions, index=idx)
-            if model.item:
-                self.prepare_tab.build_plate.update_model_item(model)
+        build_plate = self.prepare_tab.build_plate
+        # progress_update pumps the event loop, so hold plate repaints until every
+        # model has been moved rather than painting once per model.
+        build_plate.setUpdatesEnabled(False)
+        try:
+            for idx, model in enumerate(self.models):
+                if progress_update:
+                    progress_update(f"Reconfiguring models ({idx + 1}/{total_models})…")
+                self._configure_model_for_printer(model, preserve_position=preserve_positions, index=idx)
+                if model.item:
+                    build_plate.update_model_item(model)
+        finally:
+            build_plate.setUpdatesEnabled(True)
 
     def _reload_model_geometries(self, progress_update: Optional[Callable[[str], None]] = None) -> None:
         if not self.config:
@@ -2259,7 +2423,7 @@ class MainWindow(QMainWindow):
             return
         printer = self.config.printer
         # Refresh bounds so we clamp using the current rotated footprint.
-        model.display_shapes()
+        model.refresh_bounds()
         width = model.bounding_width if model.bounding_width > 0 else model.width * model.scale
         height = model.bounding_height if model.bounding_height > 0 else model.height * model.scale
         x, y = model.position
@@ -2412,14 +2576,14 @@ class MainWindow(QMainWindow):
         rotation_changed = not math.isclose(model.rotation_degrees, rotation, abs_tol=1e-7)
         previous_position = model.position
 
-        model.display_shapes()
+        model.refresh_bounds()
         previous_width = model.bounding_width if model.bounding_width > 0 else model.width * model.scale
         previous_height = model.bounding_height if model.bounding_height > 0 else model.height * model.scale
         centre_x = model.position[0] + (previous_width / 2.0 if previous_width > 0 else 0.0)
         centre_y = model.position[1] + (previous_height / 2.0 if previous_height > 0 else 0.0)
 
         model.rotation_degrees = rotation
-        model.display_shapes()
+        model.refresh_bounds()
         width_after = model.bounding_width if model.bounding_width > 0 else model.width * model.scale
         height_after = model.bounding_height if model.bounding_height > 0 else model.height * model.scale
         if width_after > 0 and height_after > 0:
@@ -2460,7 +2624,7 @@ class MainWindow(QMainWindow):
         max_scale = max(max_scale, 1e-6)
         effective_scale = min(requested_scale, max_scale) if scale_candidates else requested_scale
 
-        model.display_shapes()
+        model.refresh_bounds()
         current_scale = model.scale if model.scale > 0 else model.initial_scale
         previous_position = model.position
         previous_width = model.bounding_width if model.bounding_width > 0 else model.width * current_scale
@@ -2469,7 +2633,7 @@ class MainWindow(QMainWindow):
         centre_y = model.position[1] + (previous_height / 2.0 if previous_height > 0 else 0.0)
 
         model.scale = effective_scale
-        model.display_shapes()
+        model.refresh_bounds()
         width_after = model.bounding_width if model.bounding_width > 0 else model.width * model.scale
         height_after = model.bounding_height if model.bounding_height > 0 else model.height * model.scale
         if width_after > 0 and height_after > 0:
@@ -2991,6 +3155,8 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
         logging.getLogger().removeHandler(self._log_handler)
+        self._log_flush_timer.stop()
+        self._flush_logs()
         super().closeEvent(event)
 
 
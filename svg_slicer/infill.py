@@ -3,6 +3,8 @@ from __future__ import annotations
 import math
 from typing import Iterable, List, Sequence, Tuple
 
+import numpy as np
+import shapely
 from shapely import geometry
 from shapely.affinity import rotate
 from shapely.geometry import LineString, Point as ShapelyPoint, Polygon
@@ -354,17 +356,23 @@ def generate_rectilinear_infill(
         start = min_ry - spacing
         stop = max_ry + spacing
 
+        sweep_ys: List[float] = []
         current_y = start
+        while current_y <= stop:
+            sweep_ys.append(current_y)
+            current_y += spacing
         pass_toolpaths: List[Polyline] = []
 
-        while current_y <= stop:
-            sweep_line = LineString(
-                [
-                    (min_rx - length_margin, current_y),
-                    (max_rx + length_margin, current_y),
-                ]
-            )
-            clipped = rotated.intersection(sweep_line)
+        # Clip every sweep line against the polygon in one vectorised GEOS
+        # call instead of one Python-level intersection per line.
+        sweep_coords = np.empty((len(sweep_ys), 2, 2), dtype=np.float64)
+        sweep_coords[:, 0, 0] = min_rx - length_margin
+        sweep_coords[:, 1, 0] = max_rx + length_margin
+        sweep_coords[:, 0, 1] = sweep_ys
+        sweep_coords[:, 1, 1] = sweep_ys
+        clipped_lines = shapely.intersection(rotated, shapely.linestrings(sweep_coords))
+
+        for clipped in clipped_lines:
             segments = _collect_segments(clipped)
             for segment in segments:
                 polyline = _linestring_to_polyline(segment)
@@ -377,7 +385,6 @@ def generate_rectilinear_infill(
                     use_radians=False,
                 )
                 pass_toolpaths.append(_linestring_to_polyline(rotated_back))
-            current_y += spacing
 
         alternating: List[Polyline] = []
         for idx, polyline in enumerate(pass_toolpaths):
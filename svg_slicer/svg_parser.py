@@ -5,8 +5,10 @@ import math
 import re
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import List, Sequence, Tuple
+from typing import Iterable, List, Sequence, Tuple
 
+import numpy as np
+import shapely
 from shapely.affinity import affine_transform as shapely_affine_transform
 from shapely.affinity import scale as shapely_scale
 from shapely.affinity import translate as shapely_translate
@@ -348,22 +350,15 @@ def _text_font_available(element: Text, font_size: float) -> bool:
         return False
 
 
-def _combined_bounds(geometries: Sequence[BaseGeometry]) -> Tuple[float, float, float, float] | None:
-    bounds = [
-        geometry.bounds
-        for geometry in geometries
-        if not geometry.is_empty
-        and len(geometry.bounds) == 4
-        and all(math.isfinite(value) for value in geometry.bounds)
-    ]
-    if not bounds:
+def _combined_bounds(geometries: Iterable[BaseGeometry]) -> Tuple[float, float, float, float] | None:
+    bounds = shapely.bounds(list(geometries))
+    # Empty geometries report NaN bounds, so the finite mask drops them too.
+    bounds = bounds[np.isfinite(bounds).all(axis=1)]
+    if not len(bounds):
         return None
-    return (
-        min(bound[0] for bound in bounds),
-        min(bound[1] for bound in bounds),
-        max(bound[2] for bound in bounds),
-        max(bound[3] for bound in bounds),
-    )
+    minx, miny = bounds[:, :2].min(axis=0).tolist()
+    maxx, maxy = bounds[:, 2:].max(axis=0).tolist()
+    return minx, miny, maxx, maxy
 
 
 def _fit_lines_to_bounds(
@@ -1847,23 +1842,11 @@ def parse_svg(
 
 
 def _combined_shape_bounds(shapes: List[ShapeGeometry]) -> Tuple[float, float, float, float, float, float]:
-    bounds = [
-        shape.geometry.bounds
-        for shape in shapes
-        if not shape.geometry.is_empty
-    ]
-    finite_bounds = [
-        bound
-        for bound in bounds
-        if len(bound) == 4 and all(math.isfinite(value) for value in bound)
-    ]
-    if not finite_bounds:
+    bounds = _combined_bounds(shape.geometry for shape in shapes)
+    if bounds is None:
         raise ValueError("SVG bounds are invalid; cannot scale.")
 
-    minx = min(bound[0] for bound in finite_bounds)
-    miny = min(bound[1] for bound in finite_bounds)
-    maxx = max(bound[2] for bound in finite_bounds)
-    maxy = max(bound[3] for bound in finite_bounds)
+    minx, miny, maxx, maxy = bounds
     width = maxx - minx
     height = maxy - miny
     if width == 0 and height == 0:
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 from shapely.geometry import GeometryCollection, LineString, MultiPolygon, Polygon
+from shapely.ops import unary_union
 
 import svg_slicer.cli as cli
-from svg_slicer.gcode import Toolpath
+from svg_slicer.gcode import Toolpath, toolpaths_from_polylines
 from svg_slicer.svg_parser import ShapeGeometry
 
 
@@ -30,6 +32,66 @@ def test_geometry_to_polygons_handles_multiple_types() -> None:
     assert len(from_collection) == 2
 
 
+def test_clean_geometry_repairs_once_and_reuses_result() -> None:
+    bowtie = Polygon([(0, 0), (2, 2), (2, 0), (0, 2)])
+    assert not bowtie.is_valid
+
+    cleaned = cli._clean_geometry(bowtie)
+
+    assert cleaned.is_valid
+    assert cli._clean_geometry(cleaned) is cleaned
+
+
+def test_rings_to_polylines_simplifies_and_closes_each_ring() -> None:
+    outer = Polygon([(0, 0), (5, 0), (10, 0), (10, 10), (0, 10)])
+    hole = Polygon([(2, 2), (4, 2), (4, 4), (2, 4)])
+
+    loops = cli._rings_to_polylines([outer.exterior, hole.exterior], tolerance=0.1)
+
+    assert len(loops) == 2
+    assert loops[0].tolist() == [[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 10.0], [0.0, 0.0]]
+    assert loops[1][0].tolist() == loops[1][-1].tolist() == [2.0, 2.0]
+
+
+def test_rings_to_polylines_keeps_rings_simple_when_plain_simplify_folds_them() -> None:
+    ring = Polygon([(2, 4), (1, 3), (4, 1), (0, 1), (1, 4)]).exterior
+
+    (loop,) = cli._rings_to_polylines([ring], tolerance=1.0)
+
+    assert LineString(loop).is_simple
+    assert loop[0].tolist() == loop[-1].tolist()
+
+
+def test_generate_perimeter_loops_stops_once_offset_exceeds_half_width(monkeypatch) -> None:
+    # The midpoint vertex keeps this off the axis-aligned rectangle fast path.
+    strip = Polygon([(0, 0), (20, 0), (40, 0), (40, 2.2), (0, 2.2)])
+    offsets: list[float] = []
+    original_buffer = cli.shapely.buffer
+
+    def recording_buffer(geometry, distance, *args, **kwargs):
+        offsets.extend(distance.tolist())
+        return original_buffer(geometry, distance, *args, **kwargs)
+
+    monkeypatch.setattr(cli.shapely, "buffer", recording_buffer)
+    loops = cli._generate_perimeter_loops(strip, 0.5, 5.0, 0.0)
+
+    assert len(loops) == 3
+    assert offsets == [-0.5, -1.0]
+
+
+def test_rectangle_perimeter_loops_match_buffered_insets() -> None:
+    rectangle = Polygon([(0, 5), (10, 5), (10, 0), (0, 0)])
+    assert cli._is_axis_aligned_rectangle(rectangle)
+    assert not cli._is_axis_aligned_rectangle(Polygon([(0, 0), (10, 0), (12, 5), (0, 5)]))
+
+    loops = cli._generate_perimeter_loops(rectangle, 1.0, 10.0, 0.0)
+
+    assert len(loops) == 3
+    for pass_index, loop in enumerate(loops[1:], start=1):
+        expected = rectangle.buffer(-pass_index).exterior.coords
+        assert loop.ravel().tolist() == pytest.approx([value for point in expected for value in point])
+
+
 def test_generate_toolpaths_for_shapes_without_fit_returns_scale_1(slicer_config) -> None:
     shapes = [
         ShapeGeometry(
@@ -45,6 +107,30 @@ def test_generate_toolpaths_for_shapes_without_fit_returns_scale_1(slicer_config
     assert scale == 1.0
 
 
+def test_build_toolpaths_matches_serial_order_when_threaded(monkeypatch, slicer_config) -> None:
+    shapes = [
+        ShapeGeometry(
+            geometry=Polygon([(x, 0), (x + 6, 0), (x + 6, 6), (x, 6)]),
+            brightness=0.3,
+            stroke_width=None,
+            color=(x, 0, 0),
+        )
+        for x in (0, 10, 20, 30)
+    ]
+
+    monkeypatch.setattr(cli, "_TOOLPATH_WORKERS", 1)
+    serial = cli._build_toolpaths(shapes, slicer_config)
+    monkeypatch.setattr(cli, "_TOOLPATH_WORKERS", 4)
+    messages: list[str] = []
+    threaded = cli._build_toolpaths(shapes, slicer_config, progress_update=messages.append)
+
+    assert [path.points for path in threaded] == [path.points for path in serial]
+    assert messages[-1] == "Generating toolpaths (4/4)…"
+    assert sum(message.startswith("Generating perimeters") for message in messages) == 4
+    counts = [message for message in messages if message.startswith("Generating toolpaths")]
+    assert counts == [f"Generating toolpaths ({done}/4)…" for done in range(1, 5)]
+
+
 def test_generate_toolpaths_skips_effectively_white_shapes_in_bw_mode(slicer_config) -> None:
     shape = ShapeGeometry(
         geometry=Polygon([(0, 0), (20, 0), (20, 20), (0, 20)]),
@@ -306,6 +392,22 @@ def test_concave_shape_respects_min_fill_mode_locally(slicer_config) -> None:
     assert any(x > 3.2 for x, _ in max_mode_points)
 
 
+def test_min_mode_regions_are_the_opening_clipped_to_the_polygon() -> None:
+    # Concave outline with a hole and a thin arm the opening should drop.
+    polygon = Polygon(
+        [(0.0, 0.0), (6.0, 0.0), (6.0, 2.4), (9.0, 2.4), (9.0, 2.6), (6.0, 2.6), (6.0, 6.0), (0.0, 6.0)],
+        [[(2.0, 2.0), (4.0, 2.0), (4.0, 4.0), (2.0, 4.0)]],
+    )
+
+    regions = cli._select_infill_regions(polygon, min_fill_width=0.3, min_fill_mode="min")
+
+    combined = unary_union(regions)
+    opened = polygon.buffer(-0.15).buffer(0.15).intersection(polygon)
+    assert combined.equals(opened)
+    assert combined.difference(polygon).is_empty
+    assert combined.bounds[2] < 6.5
+
+
 def test_perimeter_count_controls_outline_passes(slicer_config) -> None:
     slicer_config.perimeter.thickness = 0.2
     slicer_config.perimeter.min_fill_width = 999.0  # disable infill for this check
@@ -396,6 +498,19 @@ def test_infill_touches_innermost_perimeter_without_extra_gap(slicer_config) ->
     assert two_count_min_y >= 0.19
 
 
+def test_toolpath_length_sums_segment_lengths() -> None:
+    assert cli._toolpath_length(Toolpath(points=((0, 0), (3, 4), (3, 10)))) == pytest.approx(11.0)
+    assert cli._toolpath_length(Toolpath(points=((1, 1),))) == 0.0
+
+
+def test_toolpath_length_follows_replaced_points() -> None:
+    (toolpath,) = toolpaths_from_polylines([[(0.0, 0.0), (3.0, 4.0)]])
+
+    moved = replace(toolpath, points=((0.0, 0.0), (6.0, 8.0), (6.0, 9.0)))
+
+    assert cli._toolpath_length(moved) == pytest.approx(11.0)
+
+
 def test_plan_color_sequence_orders_by_least_usage(color_config_path: Path) -> None:
     config = cli.load_config(color_config_path)
 
@@ -408,6 +523,37 @@ def test_plan_color_sequence_orders_by_least_usage(color_config_path: Path) -> N
     assert plan.ordered_colors[1] == "#FF0000"
 
 
+def test_plan_color_sequence_matches_neutral_sources_by_brightness(color_config_path: Path) -> None:
+    config = cli.load_config(color_config_path)
+    config.printer.available_colors = ["#FF0000", "#404040", "#C0C0C0"]
+
+    dark = Toolpath(points=((0, 0), (1, 0)), source_color=(90, 90, 90))
+    light = Toolpath(points=((0, 0), (2, 0)), source_color=(170, 170, 170))
+    red = Toolpath(points=((0, 0), (3, 0)), source_color=(200, 30, 30))
+    plan = cli._plan_color_sequence([dark, light, red], config)
+
+    assert plan is not None
+    assert dark.assigned_color == "#404040"
+    assert light.assigned_color == "#C0C0C0"
+    assert red.assigned_color == "#FF0000"
+
+
+def test_plan_color_sequence_single_color_palette_assigns_everything(color_config_path: Path) -> None:
+    config = cli.load_config(color_config_path)
+    config.printer.available_colors = ["#0000FF"]
+
+    paths = [
+        Toolpath(points=((0, 0), (3, 0)), source_color=(255, 0, 0)),
+        Toolpath(points=((0, 0), (0, 2)), source_color=None),
+    ]
+    plan = cli._plan_color_sequence(paths, config)
+
+    assert plan is not None
+    assert plan.ordered_colors == ["#0000FF"]
+    assert all(path.assigned_color == "#0000FF" for path in paths)
+    assert plan.usage_by_color["#0000FF"] == pytest.approx(5.0)
+
+
 def test_plan_color_sequence_skips_white_assigned_color(color_config_path: Path) -> None:
     config = cli.load_config(color_config_path)
     config.printer.available_colors = ["#FFFFFF", "#000000"]
@@ -531,6 +677,25 @@ def test_write_toolpaths_to_gcode_bw_mode_no_color_comments(tmp_path: Path, conf
     assert result.color_order == []
 
 
+def test_write_toolpaths_to_gcode_keeps_previous_file_when_generation_fails(
+    monkeypatch, tmp_path: Path, config_path: Path
+) -> None:
+    config = cli.load_config(config_path)
+    output = tmp_path / "keep.gcode"
+    output.write_text("G28\n", encoding="utf-8")
+
+    def failing_draw(self, *args, **kwargs):
+        self.emit_command("G1 X1 Y1")
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(cli.GcodeGenerator, "draw_toolpaths", failing_draw)
+    with pytest.raises(RuntimeError, match="boom"):
+        cli.write_toolpaths_to_gcode([Toolpath(points=((0, 0), (3, 0)))], output, config)
+
+    assert output.read_text(encoding="utf-8") == "G28\n"
+    assert not list(tmp_path.glob(".keep.gcode.*"))
+
+
 def test_main_respects_color_mode_override(monkeypatch, slicer_config, tmp_path: Path) -> None:
     called = {}
     slicer_config.printer.available_colors = ["#000000", "#FF0000"]
@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 import yaml
 
+import svg_slicer.config as config_module
 from svg_slicer.config import ConfigError, Feedrates, _normalize_hex_color, load_config
 
 
@@ -46,6 +47,9 @@ def test_feedrates_properties_convert_mm_s_to_mm_min() -> None:
     assert rates.travel_feedrate == pytest.approx(2400.0)
     assert rates.z_feedrate == pytest.approx(330.0)
 
+    rates.draw_mm_s = 20.0
+    assert rates.draw_feedrate == pytest.approx(1200.0)
+
 
 def test_normalize_hex_color_accepts_hash_and_uppercases() -> None:
     assert _normalize_hex_color("#a1b2c3") == "#A1B2C3"
@@ -57,6 +61,8 @@ def test_normalize_hex_color_rejects_bad_values() -> None:
         _normalize_hex_color("#12345")
     with pytest.raises(ConfigError):
         _normalize_hex_color("#GGGGGG")
+    with pytest.raises(ConfigError):
+        _normalize_hex_color("0x1234")
 
 
 def test_load_config_from_flat_mapping(config_path: Path) -> None:
@@ -178,3 +184,54 @@ def test_load_config_perimeter_min_fill_mode_invalid_raises(tmp_path: Path) -> N
 def test_load_config_missing_file_raises(tmp_path: Path) -> None:
     with pytest.raises(ConfigError):
         load_config(tmp_path / "missing.yaml")
+
+
+def test_load_config_reparses_after_file_changes(tmp_path: Path) -> None:
+    data = _make_base_config()
+    path = tmp_path / "cached.yaml"
+    path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+
+    first = load_config(path)
+    first.printer.start_gcode.append("G28")
+    second = load_config(path)
+
+    assert second is not first
+    assert second.printer.start_gcode == ["G21"]
+
+    data["printer"]["glide_threshold_mm"] = 12.5
+    path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+
+    assert load_config(path).printer.glide_threshold == pytest.approx(12.5)
+
+
+def test_load_config_reuses_built_config_for_unchanged_file(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "reused.yaml"
+    path.write_text(yaml.safe_dump(_make_base_config(), sort_keys=False), encoding="utf-8")
+
+    first = load_config(path)
+    monkeypatch.setattr(config_module, "_build_config", pytest.fail)
+    second = load_config(path, profile=None)
+
+    assert second == first
+    assert second is not first
+
+
+def test_load_config_reports_first_missing_required_key(tmp_path: Path) -> None:
+    data = _make_base_config()
+    del data["printer"]["origin_offsets_mm"]["y_min"]
+    del data["printer"]["origin_offsets_mm"]["y_max"]
+    path = tmp_path / "missing_offsets.yaml"
+    path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+
+    with pytest.raises(ConfigError, match="y_min"):
+        load_config(path)
+
+
+def test_load_config_reports_non_numeric_required_value(tmp_path: Path) -> None:
+    data = _make_base_config()
+    data["printer"]["bed_size_mm"]["depth"] = "deep"
+    path = tmp_path / "bad_depth.yaml"
+    path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+
+    with pytest.raises(ConfigError, match="'depth' must be a numeric value"):
+        load_config(path)
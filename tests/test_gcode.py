@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
+import numpy as np
 import pytest
 
 from svg_slicer.config import Feedrates, PrinterConfig
@@ -42,6 +45,24 @@ def test_toolpaths_from_polylines_filters_short_lines() -> None:
     assert all(len(path.points) >= 2 for path in paths)
 
 
+def test_toolpath_points_array_follows_replaced_points() -> None:
+    (path,) = toolpaths_from_polylines([[(0, 0), (1, 2), (3, 4)]])
+    assert path.points_array.tolist() == [list(point) for point in path.points]
+
+    moved = replace(path, points=((5.0, 5.0), (6.0, 6.0)))
+
+    assert moved.points_array.tolist() == [[5.0, 5.0], [6.0, 6.0]]
+
+
+def test_toolpaths_from_polylines_accepts_coordinate_arrays() -> None:
+    coords = np.array([[0.0, 0.0], [1.0, 2.0], [3.0, 4.0]])
+
+    (path,) = toolpaths_from_polylines([coords, np.zeros((1, 2))])
+
+    assert path.points == ((0.0, 0.0), (1.0, 2.0), (3.0, 4.0))
+    assert all(type(point) is tuple for point in path.points)
+
+
 def test_format_duration_variants() -> None:
     assert _format_duration(5.2) == "5.2s"
     assert _format_duration(65) == "1m 05s"
@@ -67,6 +88,55 @@ def test_gcode_generator_draw_single_toolpath_emits_motion_and_time() -> None:
     assert "s" in gen.formatted_elapsed_time()
 
 
+def test_gcode_generator_getvalue_matches_generated_lines() -> None:
+    gen = GcodeGenerator(_printer())
+    gen.emit_header()
+    gen.emit_comment("hello")
+    gen.emit_footer()
+
+    assert gen.getvalue() == "G21\n; hello\nM18\n"
+    assert gen.generate() == ["G21", "; hello", "M18"]
+    assert gen.line_count == 3
+
+
+def test_gcode_generator_streams_lines_to_given_output(tmp_path) -> None:
+    output = tmp_path / "out.gcode"
+    with output.open("w", encoding="utf-8") as stream:
+        gen = GcodeGenerator(_printer(), stream=stream)
+        gen.emit_header()
+        gen.emit_command("G0 X1 Y1")
+        gen.emit_footer()
+
+    assert output.read_text(encoding="utf-8") == "G21\nG0 X1 Y1\nM18\n"
+    assert gen.line_count == 3
+
+
+def test_gcode_generator_refuses_to_return_streamed_output(tmp_path) -> None:
+    with (tmp_path / "out.gcode").open("w", encoding="utf-8") as stream:
+        gen = GcodeGenerator(_printer(), stream=stream)
+        gen.emit_header()
+
+        with pytest.raises(RuntimeError, match="streamed to an external writer"):
+            gen.getvalue()
+        with pytest.raises(RuntimeError, match="streamed to an external writer"):
+            gen.generate()
+
+
+def test_draw_polyline_matches_per_point_linear_moves() -> None:
+    points = [(0.0, 0.0), (3.0, 4.0), (3.0, 4.0), (6.0, 0.0), (6.0, 0.0)]
+    fused = GcodeGenerator(_printer())
+    stepped = GcodeGenerator(_printer())
+
+    fused._position = stepped._position = points[0]
+    fused._draw_polyline(points, 600.0)
+    for point in points[1:]:
+        stepped._linear_move(point, 600.0)
+
+    assert fused.generate() == stepped.generate() == ["G1 X3.000 Y4.000 F600", "G1 X6.000 Y0.000"]
+    assert fused.elapsed_time_seconds == stepped.elapsed_time_seconds == pytest.approx(1.0)
+    assert fused.line_count == stepped.line_count == 2
+
+
 def test_gcode_generator_uses_raster_travel_height_for_raster_toolpaths() -> None:
     printer = _printer()
     printer.z_travel = 5.0
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+
 import pytest
 
 import svg_slicer.gui as gui
@@ -79,3 +81,227 @@ def test_prepare_tab_exposes_write_in_order_checkbox(qapp) -> None:
     tab.write_in_order_checkbox.setChecked(True)
 
     assert tab.write_in_order_enabled() is True
+
+
+def test_mirror_toolpaths_flips_y_without_touching_the_source(slicer_config) -> None:
+    toolpath = gui.Toolpath(points=((10.0, 5.0), (20.0, 15.0)), source_color=(1, 2, 3))
+
+    (mirrored,) = gui._mirror_toolpaths_for_printer([toolpath], slicer_config.printer)
+
+    y_sum = slicer_config.printer.y_min + slicer_config.printer.y_max
+    assert mirrored.points == ((10.0, y_sum - 5.0), (20.0, y_sum - 15.0))
+    assert toolpath.points == ((10.0, 5.0), (20.0, 15.0))
+    assert mirrored.source_color == (1, 2, 3)
+
+
+def test_loaded_model_reuses_transform_until_shapes_change(square_shape) -> None:
+    model = gui.LoadedModel(path=gui.Path("square.svg"), original_shapes=[square_shape])
+    model.normalized_shapes = [square_shape]
+    model.width, model.height = 20.0, 10.0
+    model.rotation_degrees = 90.0
+
+    first = model.display_shapes()
+    model.position = (5.0, 5.0)
+    moved = model.transformed_shapes()
+
+    assert first[0].geometry.bounds == pytest.approx((0.0, 0.0, 10.0, 20.0))
+    assert moved[0].geometry.bounds == pytest.approx((5.0, 5.0, 15.0, 25.0))
+    assert model.footprint_dimensions() == pytest.approx((10.0, 20.0))
+    assert len(model._transform_cache) == 1
+
+    model.normalized_shapes = [square_shape, square_shape]
+    assert len(model.display_shapes()) == 2
+    assert len(model._transform_cache) == 1
+
+
+def test_model_item_rebuilds_paths_only_when_geometry_changes(qapp, square_shape, monkeypatch) -> None:
+    model = gui.LoadedModel(path=gui.Path("square.svg"), original_shapes=[square_shape])
+    model.normalized_shapes = [square_shape]
+    model.width, model.height = 20.0, 10.0
+    item = gui.ModelGraphicsItem(model, gui.QRectF(0, 0, 200, 200), None, None)
+    calls = []
+    display_shapes = model.display_shapes
+    monkeypatch.setattr(model, "display_shapes", lambda: calls.append(1) or display_shapes())
+
+    model.position = (30.0, 40.0)
+    item.refresh_path()
+    assert calls == []
+
+    model.rotation_degrees = 90.0
+    item.refresh_path()
+    assert calls == [1]
+    assert item.path().boundingRect().width() == pytest.approx(10.0)
+
+
+def test_build_plate_grid_is_painted_without_scene_items(qapp, slicer_config) -> None:
+    from PySide6.QtWidgets import QGraphicsLineItem
+
+    view = gui.BuildPlateView()
+    view.set_printer(slicer_config.printer)
+
+    assert view._grid_lines
+    assert not any(isinstance(item, QGraphicsLineItem) for item in view._scene.items())
+
+
+def test_loaded_model_identity_transform_reuses_normalized_geometry(square_shape) -> None:
+    model = gui.LoadedModel(path=gui.Path("square.svg"), original_shapes=[square_shape])
+    model.normalized_shapes = [square_shape]
+    model.width, model.height = 20.0, 10.0
+
+    (shape,) = model.display_shapes()
+
+    assert shape.geometry is square_shape.geometry
+    assert model.footprint_dimensions() == pytest.approx((20.0, 10.0))
+
+
+def test_build_plate_merges_toolpaths_into_one_item_per_color(qapp, slicer_config) -> None:
+    view = gui.BuildPlateView()
+    view.set_printer(slicer_config.printer)
+
+    view.update_toolpaths(
+        [
+            gui.Toolpath(points=((0.0, 0.0), (10.0, 0.0)), source_color=(255, 0, 0)),
+            gui.Toolpath(points=((0.0, 5.0), (10.0, 5.0), (10.0, 9.0)), source_color=(255, 0, 0)),
+            gui.Toolpath(points=((20.0, 0.0), (30.0, 0.0)), source_color=(0, 0, 255)),
+            gui.Toolpath(points=((40.0, 0.0),), source_color=(0, 255, 0)),
+        ]
+    )
+
+    assert len(view._toolpath_items) == 2
+    red_path = view._toolpath_items[0].path()
+    assert red_path.elementCount() == 5
+    assert red_path.boundingRect().height() == pytest.approx(9.0)
+
+
+def test_build_plate_invalidates_toolpaths_once_per_arrangement_change(qapp, slicer_config, square_shape) -> None:
+    view = gui.BuildPlateView()
+    view.set_printer(slicer_config.printer)
+    model = gui.LoadedModel(path=gui.Path("square.svg"), original_shapes=[square_shape])
+    model.normalized_shapes = [square_shape]
+    model.width, model.height = 20.0, 10.0
+    view.add_model(model)
+    view.update_toolpaths([gui.Toolpath(points=((0.0, 0.0), (10.0, 0.0)))])
+    changes = []
+    view.arrangementChanged.connect(lambda: changes.append(1))
+
+    for offset in (5.0, 6.0, 7.0):
+        model.item.setPos(offset, offset)
+
+    assert changes == [1]
+    assert view._toolpath_items == []
+
+    view.update_toolpaths([gui.Toolpath(points=((0.0, 0.0), (10.0, 0.0)))])
+    model.item.setPos(8.0, 8.0)
+    assert changes == [1, 1]
+
+
+def test_prepare_tab_refresh_models_only_replaces_changed_rows(qapp, square_shape) -> None:
+    tab = gui.PrepareTab()
+    models = [
+        gui.LoadedModel(path=gui.Path(f"model_{index}.svg"), original_shapes=[square_shape])
+        for index in range(3)
+    ]
+
+    tab.refresh_models(models, selected_index=1)
+    first_item = tab.file_list.item(0)
+    tab.refresh_models(models[:2], selected_index=1)
+
+    assert tab.file_list.count() == 2
+    assert tab.file_list.item(0) is first_item
+    assert [tab.file_list.item(row).text() for row in range(2)] == ["model_0.svg", "model_1.svg"]
+    assert tab.selected_indices() == [1]
+
+
+def test_model_item_clamps_moves_to_current_bed_rect(qapp, square_shape) -> None:
+    model = gui.LoadedModel(path=gui.Path("square.svg"), original_shapes=[square_shape])
+    model.normalized_shapes = [square_shape]
+    model.width, model.height = 20.0, 10.0
+    item = gui.ModelGraphicsItem(model, gui.QRectF(0, 0, 100, 100), None, None)
+
+    item.setPos(500.0, -5.0)
+    assert (item.pos().x(), item.pos().y()) == pytest.approx((80.0, 0.0))
+
+    item.set_bed_rect(gui.QRectF(0, 0, 50, 50))
+    item.setPos(500.0, 500.0)
+    assert (item.pos().x(), item.pos().y()) == pytest.approx((30.0, 40.0))
+
+
+def test_loaded_model_keeps_footprint_queries_out_of_geometry_cache(square_shape) -> None:
+    model = gui.LoadedModel(path=gui.Path("square.svg"), original_shapes=[square_shape])
+    model.normalized_shapes = [square_shape]
+    model.width, model.height = 20.0, 10.0
+
+    for step in range(20):
+        model.footprint_dimensions(scale=1.0 + step / 10.0, rotation=45.0)
+
+    assert model._transform_cache == {}
+    assert len(model._bounds_cache) == 20
+    assert model.footprint_dimensions(scale=1.0, rotation=90.0) == pytest.approx((10.0, 20.0))
+
+
+def test_prepare_tab_coalesces_footprint_updates_while_scrubbing(qapp, square_shape) -> None:
+    tab = gui.PrepareTab()
+    model = gui.LoadedModel(path=gui.Path("square.svg"), original_shapes=[square_shape])
+    model.normalized_shapes = [square_shape]
+    model.width, model.height = 20.0, 10.0
+    tab.update_scale_controls(model)
+
+    tab.scale_spin.setValue(150.0)
+    tab.scale_spin.setValue(200.0)
+
+    assert tab._footprint_update_timer.isActive()
+    assert tab.footprint_width_spin.value() == pytest.approx(20.0)
+
+    tab._footprint_update_timer.stop()
+    tab._refresh_pending_footprint()
+
+    assert tab.footprint_width_spin.value() == pytest.approx(40.0)
+    assert tab.footprint_height_spin.value() == pytest.approx(20.0)
+
+
+def test_loaded_model_refresh_bounds_matches_display_shapes(square_shape) -> None:
+    model = gui.LoadedModel(path=gui.Path("square.svg"), original_shapes=[square_shape])
+    model.normalized_shapes = [square_shape]
+    model.width, model.height = 20.0, 10.0
+    model.scale = 2.0
+    model.rotation_degrees = 30.0
+
+    model.refresh_bounds()
+    refreshed = (model.bounding_width, model.bounding_height, model._origin_offset)
+    assert model._transform_cache == {}
+
+    model.display_shapes()
+    assert refreshed == (model.bounding_width, model.bounding_height, model._origin_offset)
+
+
+def test_settings_tab_apply_skips_unchanged_config(qapp, slicer_config) -> None:
+    tab = gui.SettingsTab()
+    tab.set_config(slicer_config, profiles=[], current_profile=None)
+    # Round-trip once so spin-box rounding does not count as a change.
+    tab.set_config(tab._assemble_config(), profiles=[], current_profile=None)
+    applied = []
+    tab.configApplied.connect(applied.append)
+
+    tab._on_apply_clicked()
+    assert applied == []
+
+    tab.glide_threshold_spin.setValue(tab.glide_threshold_spin.value() + 0.5)
+    tab._on_apply_clicked()
+    assert len(applied) == 1
+
+
+def test_main_window_relays_worker_logs_and_flushes_them_on_close(qapp, config_path) -> None:
+    window = gui.MainWindow(config_path)
+    window._flush_logs()
+    worker = threading.Thread(target=gui.logging.getLogger("svg_slicer.test").info, args=("from worker",))
+    worker.start()
+    worker.join()
+
+    assert "from worker" not in window._log_buffer
+    qapp.processEvents()
+    assert list(window._log_buffer) == ["[INFO] from worker"]
+
+    window.close()
+
+    assert not window._log_buffer
+    assert window.log_output.toPlainText().endswith("[INFO] from worker")